@@ -68,7 +68,7 @@ class ContaBancaria:
         print(f"🎯 Saques realizados hoje: {self.saques_hoje}/{self.max_saques_diarios}")
         print("="*50 + "\n")
     
-    def menu(self):
+    def menu(self, entrada=input):
         while True:
             print("\n🏦 SISTEMA BANCÁRIO")
             print("1. Depósito")
@@ -76,18 +76,18 @@ class ContaBancaria:
             print("3. Extrato")
             print("4. Sair")
             
-            opcao = input("\nEscolha uma opção (1-4): ")
+            opcao = entrada("\nEscolha uma opção (1-4): ")
             
             if opcao == "1":
                 try:
-                    valor = float(input("Digite o valor para depósito: R$ "))
+                    valor = float(entrada("Digite o valor para depósito: R$ "))
                     self.depositar(valor)
                 except ValueError:
                     print("❌ Erro: Digite um valor numérico válido.")
             
             elif opcao == "2":
                 try:
-                    valor = float(input("Digite o valor para saque: R$ "))
+                    valor = float(entrada("Digite o valor para saque: R$ "))
                     self.sacar(valor)
                 except ValueError:
                     print("❌ Erro: Digite um valor numérico válido.")
@@ -1,5 +1,5 @@
 import datetime
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List
 
 # Listas globais para armazenamento
 usuarios: List[Dict[str, Any]] = []
@@ -242,8 +242,14 @@ def listar_contas():
         print(f"Titular: {conta['usuario']['nome']} (CPF: {conta['usuario']['cpf']})")
         print(f"Saldo: R$ {conta['saldo']:.2f}")
 
-def menu_principal():
-    """Menu principal do sistema bancário."""
+def menu_principal(entrada: Callable[[str], str] = input):
+    """
+    Menu principal do sistema bancário.
+    
+    Args:
+        entrada: Função usada para ler cada resposta (padrão: input). Permite
+            alimentar o menu com um roteiro, sem depender do teclado.
+    """
     while True:
         print("\n" + "="*50)
         print("🏦 SISTEMA BANCÁRIO")
@@ -257,14 +263,14 @@ def menu_principal():
         print("7. Extrato")
         print("8. Sair")
         
-        opcao = input("\nEscolha uma opção (1-8): ").strip()
+        opcao = entrada("\nEscolha uma opção (1-8): ").strip()
         
         if opcao == "1":
             print("\n📝 CADASTRAR USUÁRIO")
-            nome = input("Nome completo: ").strip()
-            data_nascimento = input("Data de nascimento (DD/MM/AAAA): ").strip()
-            cpf = input("CPF: ").strip()
-            endereco = input("Endereço (logradouro, nro - bairro - cidade/sigla estado): ").strip()
+            nome = entrada("Nome completo: ").strip()
+            data_nascimento = entrada("Data de nascimento (DD/MM/AAAA): ").strip()
+            cpf = entrada("CPF: ").strip()
+            endereco = entrada("Endereço (logradouro, nro - bairro - cidade/sigla estado): ").strip()
             cadastrar_usuario(nome, data_nascimento, cpf, endereco)
         
         elif opcao == "2":
@@ -273,7 +279,7 @@ def menu_principal():
                 print("❌ Nenhum usuário cadastrado. Cadastre um usuário primeiro.")
                 continue
             
-            cpf = input("CPF do usuário: ").strip()
+            cpf = entrada("CPF do usuário: ").strip()
             cadastrar_conta_bancaria(cpf)
         
         elif opcao == "3":
@@ -285,7 +291,7 @@ def menu_principal():
         elif opcao == "5":
             print("\n📥 DEPÓSITO")
             try:
-                valor = float(input("Valor do depósito: R$ "))
+                valor = float(entrada("Valor do depósito: R$ "))
                 depositar(valor)  # positional only
             except ValueError:
                 print("❌ Erro: Digite um valor numérico válido.")
@@ -293,7 +299,7 @@ def menu_principal():
         elif opcao == "6":
             print("\n📤 SAQUE")
             try:
-                valor = float(input("Valor do saque: R$ "))
+                valor = float(entrada("Valor do saque: R$ "))
                 sacar(valor=valor)  # keyword only
             except ValueError:
                 print("❌ Erro: Digite um valor numérico válido.")
@@ -1,6 +1,36 @@
 import datetime
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from limites import MotorLimites
+
+# Eventos de domínio
+class EventoTransacao(NamedTuple):
+    tipo: str
+    numero_conta: int
+    cpf: str
+    valor: float
+    saldo: float
+    saques_hoje: int
+    limite_saques: int
+    data: datetime.datetime
+
+class BarramentoEventos:
+    """Distribui os eventos de domínio para os assinantes (projeções, réplicas, etc)."""
+    def __init__(self):
+        self._assinantes: List[Callable[[EventoTransacao], None]] = []
+    
+    def assinar(self, assinante: Callable[[EventoTransacao], None]):
+        self._assinantes.append(assinante)
+    
+    def publicar(self, evento: EventoTransacao):
+        for assinante in self._assinantes:
+            assinante(evento)
 
 # Interface Transacao
 class Transacao(ABC):
@@ -10,30 +40,151 @@ class Transacao(ABC):
 
 # Classes concretas de Transacao
 class Deposito(Transacao):
-    def __init__(self, valor: float):
+    def __init__(self, valor: float, chave_idempotencia: Optional[str] = None):
         self._valor = valor
+        self._chave_idempotencia = chave_idempotencia
     
     @property
     def valor(self) -> float:
         return self._valor
     
-    def registrar(self, conta):
+    @property
+    def chave_idempotencia(self) -> Optional[str]:
+        return self._chave_idempotencia
+    
+    def registrar(self, conta) -> bool:
         sucesso_transacao = conta.depositar(self.valor)
         if sucesso_transacao:
             conta.historico.adicionar_transacao(self)
+            conta.publicar_evento(self.__class__.__name__, self.valor)
+        return sucesso_transacao
 
 class Saque(Transacao):
-    def __init__(self, valor: float):
+    def __init__(self, valor: float, chave_idempotencia: Optional[str] = None):
         self._valor = valor
+        self._chave_idempotencia = chave_idempotencia
     
     @property
     def valor(self) -> float:
         return self._valor
     
-    def registrar(self, conta):
+    @property
+    def chave_idempotencia(self) -> Optional[str]:
+        return self._chave_idempotencia
+    
+    def registrar(self, conta) -> bool:
         sucesso_transacao = conta.sacar(self.valor)
         if sucesso_transacao:
             conta.historico.adicionar_transacao(self)
+            conta.publicar_evento(self.__class__.__name__, self.valor)
+        return sucesso_transacao
+
+# Cache de idempotência (LRU + TTL)
+class ConflitoIdempotencia(Exception):
+    """A chave de idempotência já foi usada em uma operação diferente."""
+
+class CacheIdempotencia:
+    """
+    Guarda o resultado de transações já processadas, indexado pela chave de
+    idempotência enviada pelo cliente. Uma repetição (retry) com a mesma chave
+    devolve o resultado original sem executar a operação novamente.
+    
+    Cada resultado é guardado junto com a impressão digital da operação
+    (conta, tipo, valor): reutilizar a chave em outra operação lança
+    ConflitoIdempotencia em vez de devolver um resultado que não se aplica.
+    
+    O tamanho é limitado por `capacidade` (descarta a entrada menos usada) e
+    cada entrada expira após `ttl_segundos`.
+    """
+    def __init__(self, capacidade: int = 10000, ttl_segundos: float = 300.0,
+                 relogio: Callable[[], float] = time.monotonic):
+        if capacidade <= 0:
+            raise ValueError("A capacidade do cache deve ser positiva.")
+        self._capacidade = capacidade
+        self._ttl = ttl_segundos
+        self._relogio = relogio
+        self._entradas: "OrderedDict[str, tuple]" = OrderedDict()
+        # Chaves cuja operação está em execução; quem chegar com a mesma chave espera o Event
+        self._em_andamento: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._acertos = 0
+        self._faltas = 0
+        self._conflitos = 0
+    
+    @property
+    def acertos(self) -> int:
+        return self._acertos
+    
+    @property
+    def faltas(self) -> int:
+        return self._faltas
+    
+    @property
+    def conflitos(self) -> int:
+        return self._conflitos
+    
+    def __len__(self) -> int:
+        return len(self._entradas)
+    
+    def _buscar(self, chave: str, agora: float):
+        entrada = self._entradas.get(chave)
+        if entrada is None:
+            return None
+        expira_em = entrada[0]
+        if expira_em <= agora:
+            del self._entradas[chave]
+            return None
+        self._entradas.move_to_end(chave)
+        return entrada
+    
+    def _guardar(self, chave: str, impressao: tuple, resultado: Any, agora: float):
+        self._entradas[chave] = (agora + self._ttl, impressao, resultado)
+        self._entradas.move_to_end(chave)
+        # Remove entradas expiradas do início e, se ainda necessário, as menos usadas
+        while self._entradas:
+            chave_antiga, (expira_em, _, _) = next(iter(self._entradas.items()))
+            if expira_em > agora and len(self._entradas) <= self._capacidade:
+                break
+            del self._entradas[chave_antiga]
+    
+    def executar(self, chave: str, impressao: tuple, operacao: Callable[[], Any]) -> Any:
+        # O lock protege só o cache. A operação roda fora dele, com a chave
+        # marcada como em andamento: retries simultâneos da mesma chave esperam
+        # o resultado, e chaves diferentes não ficam serializadas entre si.
+        while True:
+            with self._lock:
+                entrada = self._buscar(chave, self._relogio())
+                if entrada is None:
+                    pendente = self._em_andamento.get(chave)
+                    if pendente is None:
+                        pendente = self._em_andamento[chave] = threading.Event()
+                        self._faltas += 1
+                        break
+                else:
+                    _, impressao_original, resultado = entrada
+                    if impressao_original != impressao:
+                        self._conflitos += 1
+                        raise ConflitoIdempotencia(
+                            f"A chave '{chave}' já foi usada em outra operação."
+                        )
+                    self._acertos += 1
+            
+            if entrada is not None:
+                # Mensagem fora do lock: um stdout lento não pode travar as outras chaves
+                print(f"🔁 Transação '{chave}' já processada. Devolvendo resultado original.")
+                return resultado
+            # Outra thread está executando esta chave: espera e consulta o cache de novo
+            pendente.wait()
+        
+        try:
+            resultado = operacao()
+            with self._lock:
+                self._guardar(chave, impressao, resultado, self._relogio())
+            return resultado
+        finally:
+            with self._lock:
+                del self._em_andamento[chave]
+            pendente.set()
 
 # Classe Historico
 class Historico:
@@ -45,10 +196,13 @@ class Historico:
         return self._transacoes
     
     def adicionar_transacao(self, transacao: Transacao):
+        self.adicionar_lancamento(transacao.__class__.__name__, transacao.valor, datetime.datetime.now())
+    
+    def adicionar_lancamento(self, tipo: str, valor: float, data: datetime.datetime):
         self._transacoes.append({
-            'tipo': transacao.__class__.__name__,
-            'valor': transacao.valor,
-            'data': datetime.datetime.now()
+            'tipo': tipo,
+            'valor': valor,
+            'data': data
         })
 
 # Classe base Cliente
@@ -57,8 +211,8 @@ class Cliente(ABC):
         self._endereco = endereco
         self._contas: List[Conta] = []
     
-    def realizar_transacao(self, conta, transacao: Transacao):
-        transacao.registrar(conta)
+    def realizar_transacao(self, conta, transacao: Transacao) -> bool:
+        return transacao.registrar(conta)
     
     def adicionar_conta(self, conta):
         self._contas.append(conta)
@@ -102,6 +256,7 @@ class Conta:
         self._agencia = agencia
         self._cliente = cliente
         self._historico = Historico()
+        self._barramento: Optional[BarramentoEventos] = None
     
     @classmethod
     def nova_conta(cls, cliente: Cliente, numero: int) -> 'Conta':
@@ -127,6 +282,30 @@ class Conta:
     def historico(self) -> Historico:
         return self._historico
     
+    def conectar_barramento(self, barramento: BarramentoEventos):
+        self._barramento = barramento
+    
+    def __getstate__(self):
+        # O barramento pertence ao sistema em execução e não é serializado
+        estado = self.__dict__.copy()
+        estado['_barramento'] = None
+        return estado
+    
+    def _contadores_saque(self) -> tuple:
+        # Conta simples não tem limite de saques diários
+        return (0, 0)
+    
+    def criar_evento(self, tipo: str, valor: float) -> EventoTransacao:
+        saques_hoje, limite_saques = self._contadores_saque()
+        return EventoTransacao(
+            tipo, self.numero, self.cliente.cpf, valor, self.saldo,
+            saques_hoje, limite_saques, datetime.datetime.now()
+        )
+    
+    def publicar_evento(self, tipo: str, valor: float):
+        if self._barramento is not None:
+            self._barramento.publicar(self.criar_evento(tipo, valor))
+    
     def sacar(self, valor: float) -> bool:
         if valor <= 0:
             print("❌ Erro: O valor do saque deve ser positivo.")
@@ -148,6 +327,15 @@ class Conta:
         self._saldo += valor
         print(f"✅ Depósito de R$ {valor:.2f} realizado com sucesso!")
         return True
+    
+    def aplicar_lancamento(self, tipo: str, valor: float, data: datetime.datetime):
+        """
+        Lançamento feito pelo banco (juros, tarifas) em processamento em lote:
+        não passa pelos limites de saque nem imprime mensagens.
+        """
+        self._saldo += valor if tipo == 'Deposito' else -valor
+        self._historico.adicionar_lancamento(tipo, valor, data)
+        self.publicar_evento(tipo, valor)
 
 # Classe ContaCorrente (herda de Conta)
 class ContaCorrente(Conta):
@@ -183,6 +371,9 @@ class ContaCorrente(Conta):
         
         return sucesso
     
+    def _contadores_saque(self) -> tuple:
+        return (self.saques_hoje, self._limite_saques)
+    
     @property
     def limite(self) -> float:
         return self._limite
@@ -193,23 +384,125 @@ class ContaCorrente(Conta):
     
     @property
     def saques_hoje(self) -> int:
+        # O contador só é zerado no próximo saque; até lá, um dia anterior vale 0
+        if self._ultima_data < datetime.date.today():
+            return 0
         return self._saques_hoje
 
+# Visões de leitura (snapshots consistentes)
+class EstadoConta(NamedTuple):
+    saldo: float
+    transacoes: int  # quantidade de entradas do histórico visíveis nesta versão
+    saques_hoje: int
+
+class VisaoLeitura:
+    """
+    Retrato do sistema em um instante. Os estados das contas são tuplas
+    imutáveis (cada transação troca a tupla da conta, nunca altera a antiga) e
+    o histórico só recebe novas entradas no final: guardar o tamanho do
+    histórico basta para reler exatamente as transações daquela versão.
+
+    A captura não é gratuita: copia o dicionário de estados e as listas de
+    contas e clientes, O(N) no número de contas, e durante a cópia os
+    escritores esperam pelo GIL. Depois disso a leitura não trava ninguém.
+    """
+    def __init__(self, versao: int, estados: Dict[int, EstadoConta],
+                 contas: List['Conta'], clientes: List['PessoaFisica']):
+        self._versao = versao
+        self._estados = estados
+        self._todas_contas = contas
+        self._contas: Optional[List['Conta']] = None
+        self._clientes = clientes
+    
+    @property
+    def versao(self) -> int:
+        return self._versao
+    
+    @property
+    def contas(self) -> List['Conta']:
+        # Filtrado no primeiro acesso, pelo leitor, e não durante a captura
+        if self._contas is None:
+            self._contas = [conta for conta in self._todas_contas if conta.numero in self._estados]
+        return self._contas
+    
+    @property
+    def clientes(self) -> List['PessoaFisica']:
+        return self._clientes
+    
+    def estado(self, numero_conta: int) -> Optional[EstadoConta]:
+        return self._estados.get(numero_conta)
+    
+    def transacoes(self, conta: 'Conta') -> list:
+        estado = self._estados.get(conta.numero)
+        if estado is None:
+            return []
+        return conta.historico.transacoes[:estado.transacoes]
+
 # Sistema Bancário
 class SistemaBancario:
-    def __init__(self):
+    def __init__(self, cache_idempotencia: Optional[CacheIdempotencia] = None,
+                 motor_limites: Optional["MotorLimites"] = None):
         self._clientes: List[PessoaFisica] = []
         self._contas: List[Conta] = []
         self._numero_conta_sequencial = 1
+        # Índices para busca direta por CPF e número da conta
+        self._clientes_por_cpf: Dict[str, PessoaFisica] = {}
+        self._contas_por_numero: Dict[int, Conta] = {}
+        self._cache_idempotencia = cache_idempotencia if cache_idempotencia is not None else CacheIdempotencia()
+        self._barramento = BarramentoEventos()
+        # Políticas de limite adicionais (ver limites.MotorLimites)
+        self._motor_limites = motor_limites
+        # Estado publicado de cada conta, lido pelas visões de leitura
+        self._estados: Dict[int, EstadoConta] = {}
+        self._versao = 0
+        self._barramento.assinar(self._atualizar_estado)
+    
+    @property
+    def cache_idempotencia(self) -> CacheIdempotencia:
+        return self._cache_idempotencia
+    
+    @property
+    def barramento(self) -> BarramentoEventos:
+        return self._barramento
+    
+    @property
+    def contas(self) -> List[Conta]:
+        return self._contas
+    
+    @property
+    def clientes(self) -> List[PessoaFisica]:
+        return self._clientes
+    
+    def assinar_eventos(self, assinante: Callable[[EventoTransacao], None]):
+        self._barramento.assinar(assinante)
+    
+    def _atualizar_estado(self, evento: EventoTransacao):
+        conta = self.encontrar_conta_por_numero(evento.numero_conta)
+        # Uma única atribuição no dicionário: o leitor vê o estado antigo ou o novo, nunca metade
+        self._estados[evento.numero_conta] = EstadoConta(
+            evento.saldo, len(conta.historico.transacoes), evento.saques_hoje
+        )
+        self._versao += 1
+    
+    def capturar_visao(self) -> VisaoLeitura:
+        """
+        Retorna uma visão consistente do sistema para relatórios. Custa uma
+        cópia O(N) dos estados e das listas (ver VisaoLeitura).
+        """
+        # As listas são copiadas antes dos estados: contas criadas depois disso
+        # não têm estado na cópia e ficam fora da visão
+        contas = list(self.contas)
+        clientes = list(self.clientes)
+        versao = self._versao
+        return VisaoLeitura(versao, self._estados.copy(), contas, clientes)
     
     def cadastrar_cliente(self, cpf: str, nome: str, data_nascimento: str, endereco: str) -> bool:
         # Verificar se CPF já existe
         cpf_limpo = ''.join(filter(str.isdigit, cpf))
         
-        for cliente in self._clientes:
-            if cliente.cpf == cpf_limpo:
-                print("❌ Erro: Já existe um cliente cadastrado com este CPF.")
-                return False
+        if self.encontrar_cliente_por_cpf(cpf_limpo) is not None:
+            print("❌ Erro: Já existe um cliente cadastrado com este CPF.")
+            return False
         
         # Converter string para date
         try:
@@ -221,6 +514,7 @@ class SistemaBancario:
         # Criar novo cliente
         novo_cliente = PessoaFisica(cpf_limpo, nome, data, endereco)
         self._clientes.append(novo_cliente)
+        self._clientes_por_cpf[cpf_limpo] = novo_cliente
         print(f"✅ Cliente {nome} cadastrado com sucesso!")
         return True
     
@@ -228,11 +522,7 @@ class SistemaBancario:
         cpf_limpo = ''.join(filter(str.isdigit, cpf))
         
         # Encontrar cliente
-        cliente_encontrado = None
-        for cliente in self._clientes:
-            if cliente.cpf == cpf_limpo:
-                cliente_encontrado = cliente
-                break
+        cliente_encontrado = self.encontrar_cliente_por_cpf(cpf_limpo)
         
         if not cliente_encontrado:
             print("❌ Erro: Cliente não encontrado.")
@@ -242,50 +532,85 @@ class SistemaBancario:
         nova_conta = ContaCorrente.nova_conta(cliente_encontrado, self._numero_conta_sequencial)
         cliente_encontrado.adicionar_conta(nova_conta)
         self._contas.append(nova_conta)
+        self._contas_por_numero[nova_conta.numero] = nova_conta
+        nova_conta.conectar_barramento(self._barramento)
+        nova_conta.publicar_evento('Abertura', 0.0)
         
         print(f"✅ Conta {self._numero_conta_sequencial} criada com sucesso para {cliente_encontrado.nome}!")
         self._numero_conta_sequencial += 1
         return True
     
+    def tem_clientes(self) -> bool:
+        return bool(self._clientes)
+    
     def encontrar_conta_por_numero(self, numero: int) -> Optional[Conta]:
-        for conta in self._contas:
-            if conta.numero == numero:
-                return conta
-        return None
+        return self._contas_por_numero.get(numero)
     
     def encontrar_cliente_por_cpf(self, cpf: str) -> Optional[PessoaFisica]:
         cpf_limpo = ''.join(filter(str.isdigit, cpf))
-        for cliente in self._clientes:
-            if cliente.cpf == cpf_limpo:
-                return cliente
-        return None
+        return self._clientes_por_cpf.get(cpf_limpo)
+    
+    def _processar_transacao(self, conta: Conta, transacao: Transacao) -> bool:
+        if self._motor_limites is None:
+            return conta.cliente.realizar_transacao(conta, transacao)
+        
+        tipo = transacao.__class__.__name__
+        violacao, reserva = self._motor_limites.reservar(conta, tipo, transacao.valor)
+        if violacao:
+            print(f"❌ Erro: {violacao}")
+            return False
+        
+        sucesso = conta.cliente.realizar_transacao(conta, transacao)
+        if not sucesso:
+            self._motor_limites.cancelar(reserva)
+        return sucesso
+    
+    def _executar_transacao(self, conta: Conta, transacao: Transacao) -> bool:
+        if transacao.chave_idempotencia is None:
+            return self._processar_transacao(conta, transacao)
+        
+        impressao = (conta.numero, transacao.__class__.__name__, transacao.valor)
+        try:
+            return self._cache_idempotencia.executar(
+                transacao.chave_idempotencia,
+                impressao,
+                lambda: self._processar_transacao(conta, transacao)
+            )
+        except ConflitoIdempotencia as erro:
+            print(f"❌ Erro: {erro}")
+            return False
     
-    def depositar(self, numero_conta: int, valor: float) -> bool:
+    def depositar(self, numero_conta: int, valor: float, chave_idempotencia: Optional[str] = None) -> bool:
         conta = self.encontrar_conta_por_numero(numero_conta)
         if not conta:
             print("❌ Erro: Conta não encontrada.")
             return False
         
-        deposito = Deposito(valor)
-        conta.cliente.realizar_transacao(conta, deposito)
-        return True
+        deposito = Deposito(valor, chave_idempotencia)
+        return self._executar_transacao(conta, deposito)
     
-    def sacar(self, numero_conta: int, valor: float) -> bool:
+    def sacar(self, numero_conta: int, valor: float, chave_idempotencia: Optional[str] = None) -> bool:
         conta = self.encontrar_conta_por_numero(numero_conta)
         if not conta:
             print("❌ Erro: Conta não encontrada.")
             return False
         
-        saque = Saque(valor)
-        conta.cliente.realizar_transacao(conta, saque)
-        return True
+        saque = Saque(valor, chave_idempotencia)
+        return self._executar_transacao(conta, saque)
     
-    def extrato(self, numero_conta: int):
+    def extrato(self, numero_conta: int, visao: Optional[VisaoLeitura] = None):
         conta = self.encontrar_conta_por_numero(numero_conta)
-        if not conta:
+        estado = visao.estado(numero_conta) if visao is not None else None
+        if not conta or (visao is not None and estado is None):
             print("❌ Erro: Conta não encontrada.")
             return
         
+        if visao is not None:
+            saldo, transacoes, saques_hoje = estado.saldo, visao.transacoes(conta), estado.saques_hoje
+        else:
+            saldo, transacoes = conta.saldo, conta.historico.transacoes
+            saques_hoje = conta.saques_hoje if isinstance(conta, ContaCorrente) else 0
+        
         print("\n" + "="*50)
         print("📋 EXTRATO BANCÁRIO")
         print("="*50)
@@ -293,7 +618,6 @@ class SistemaBancario:
         print(f"Cliente: {conta.cliente.nome}")
         
         # Exibir transações
-        transacoes = conta.historico.transacoes
         if transacoes:
             print("\n📊 HISTÓRICO DE TRANSAÇÕES:")
             for i, transacao in enumerate(transacoes, 1):
@@ -303,16 +627,17 @@ class SistemaBancario:
             print("\n📊 Nenhuma transação realizada.")
         
         print("\n" + "-"*50)
-        print(f"💰 SALDO ATUAL: R$ {conta.saldo:.2f}")
+        print(f"💰 SALDO ATUAL: R$ {saldo:.2f}")
         
         if isinstance(conta, ContaCorrente):
-            print(f"🎯 Saques realizados hoje: {conta.saques_hoje}/{conta.limite_saques}")
+            print(f"🎯 Saques realizados hoje: {saques_hoje}/{conta.limite_saques}")
             print(f"📈 Limite por saque: R$ {conta.limite:.2f}")
         
         print("="*50 + "\n")
     
-    def listar_clientes(self):
-        if not self._clientes:
+    def listar_clientes(self, visao: Optional[VisaoLeitura] = None):
+        clientes = visao.clientes if visao is not None else self.clientes
+        if not clientes:
             print("📝 Nenhum cliente cadastrado.")
             return
         
@@ -320,15 +645,20 @@ class SistemaBancario:
         print("👥 CLIENTES CADASTRADOS")
         print("="*50)
         
-        for i, cliente in enumerate(self._clientes, 1):
+        for i, cliente in enumerate(clientes, 1):
+            if visao is not None:
+                quantidade_contas = sum(1 for conta in cliente.contas if visao.estado(conta.numero))
+            else:
+                quantidade_contas = len(cliente.contas)
             print(f"\n{i}. Nome: {cliente.nome}")
             print(f"   CPF: {cliente.cpf}")
             print(f"   Data Nasc.: {cliente.data_nascimento.strftime('%d/%m/%Y')}")
             print(f"   Endereço: {cliente.endereco}")
-            print(f"   Contas: {len(cliente.contas)}")
+            print(f"   Contas: {quantidade_contas}")
     
-    def listar_contas(self):
-        if not self._contas:
+    def listar_contas(self, visao: Optional[VisaoLeitura] = None):
+        contas = visao.contas if visao is not None else self.contas
+        if not contas:
             print("🏦 Nenhuma conta cadastrada.")
             return
         
@@ -336,13 +666,14 @@ class SistemaBancario:
         print("🏦 CONTAS CADASTRADAS")
         print("="*50)
         
-        for conta in self._contas:
+        for conta in contas:
+            saldo = visao.estado(conta.numero).saldo if visao is not None else conta.saldo
             print(f"\nAgência: {conta.agencia} | Conta: {conta.numero}")
             print(f"Titular: {conta.cliente.nome} (CPF: {conta.cliente.cpf})")
-            print(f"Saldo: R$ {conta.saldo:.2f}")
+            print(f"Saldo: R$ {saldo:.2f}")
             print(f"Tipo: {'Conta Corrente' if isinstance(conta, ContaCorrente) else 'Conta'}")
 
-    def menu_principal(self):
+    def menu_principal(self, entrada: Callable[[str], str] = input):
         while True:
             print("\n" + "="*50)
             print("🏦 SISTEMA BANCÁRIO")
@@ -356,23 +687,23 @@ class SistemaBancario:
             print("7. Extrato")
             print("8. Sair")
             
-            opcao = input("\nEscolha uma opção (1-8): ").strip()
+            opcao = entrada("\nEscolha uma opção (1-8): ").strip()
             
             if opcao == "1":
                 print("\n📝 CADASTRAR CLIENTE")
-                nome = input("Nome completo: ").strip()
-                cpf = input("CPF: ").strip()
-                data_nascimento = input("Data de nascimento (DD/MM/AAAA): ").strip()
-                endereco = input("Endereço (logradouro, nro - bairro - cidade/sigla estado): ").strip()
+                nome = entrada("Nome completo: ").strip()
+                cpf = entrada("CPF: ").strip()
+                data_nascimento = entrada("Data de nascimento (DD/MM/AAAA): ").strip()
+                endereco = entrada("Endereço (logradouro, nro - bairro - cidade/sigla estado): ").strip()
                 self.cadastrar_cliente(cpf, nome, data_nascimento, endereco)
             
             elif opcao == "2":
                 print("\n🏦 CADASTRAR CONTA CORRENTE")
-                if not self._clientes:
+                if not self.tem_clientes():
                     print("❌ Nenhum cliente cadastrado. Cadastre um cliente primeiro.")
                     continue
                 
-                cpf = input("CPF do cliente: ").strip()
+                cpf = entrada("CPF do cliente: ").strip()
                 self.cadastrar_conta_corrente(cpf)
             
             elif opcao == "3":
@@ -384,8 +715,8 @@ class SistemaBancario:
             elif opcao == "5":
                 print("\n📥 DEPÓSITO")
                 try:
-                    numero_conta = int(input("Número da conta: "))
-                    valor = float(input("Valor do depósito: R$ "))
+                    numero_conta = int(entrada("Número da conta: "))
+                    valor = float(entrada("Valor do depósito: R$ "))
                     self.depositar(numero_conta, valor)
                 except ValueError:
                     print("❌ Erro: Digite valores numéricos válidos.")
@@ -393,8 +724,8 @@ class SistemaBancario:
             elif opcao == "6":
                 print("\n📤 SAQUE")
                 try:
-                    numero_conta = int(input("Número da conta: "))
-                    valor = float(input("Valor do saque: R$ "))
+                    numero_conta = int(entrada("Número da conta: "))
+                    valor = float(entrada("Valor do saque: R$ "))
                     self.sacar(numero_conta, valor)
                 except ValueError:
                     print("❌ Erro: Digite valores numéricos válidos.")
@@ -402,7 +733,7 @@ class SistemaBancario:
             elif opcao == "7":
                 print("\n📋 EXTRATO")
                 try:
-                    numero_conta = int(input("Número da conta: "))
+                    numero_conta = int(entrada("Número da conta: "))
                     self.extrato(numero_conta)
                 except ValueError:
                     print("❌ Erro: Digite um número de conta válido.")
@@ -415,7 +746,13 @@ class SistemaBancario:
                 print("❌ Opção inválida. Tente novamente.")
 
 def main():
-    sistema = SistemaBancario()
+    # Uso: python SistemaBancarioFinal.py [arquivo_snapshot]
+    if len(sys.argv) > 1:
+        # Importação tardia: só é necessária quando há um snapshot para restaurar
+        from snapshot import restaurar_snapshot
+        sistema = restaurar_snapshot(sys.argv[1])
+    else:
+        sistema = SistemaBancario()
     print("Bem-vindo ao Sistema Bancário em POO!")
     sistema.menu_principal()
 
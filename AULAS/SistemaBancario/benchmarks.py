@@ -0,0 +1,567 @@
+import contextlib
+import datetime
+import io
+import json
+import multiprocessing
+import os
+import pickle
+import queue
+import random
+import sys
+import threading
+import time
+from typing import List, Tuple
+
+from codec import (
+    codificar_contas, codificar_transacoes, decodificar_contas, decodificar_transacoes, registros_da_conta
+)
+from limites import LimiteJanela, LimitePorOperacao, MotorLimites
+from lote import JobLote, JurosSobreSaldo, RegraLote
+from projecoes import ProjecaoLimiteDiario, ProjecaoSaldos, ProjecaoTotaisCliente
+from replica import ReplicaLeitura
+from snapshot import restaurar_snapshot, salvar_snapshot
+from SistemaBancarioFinal import CacheIdempotencia, EventoTransacao, SistemaBancario
+
+# Utilitários
+def silenciar():
+    """Descarta os prints das operações durante as medições."""
+    return contextlib.redirect_stdout(io.StringIO())
+
+def medir(funcao, repeticoes: int) -> float:
+    """Executa `funcao` `repeticoes` vezes e retorna o tempo médio em microssegundos."""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1e6
+
+def cadastrar_contas(sistema: SistemaBancario, qtd_contas: int):
+    with silenciar():
+        for i in range(qtd_contas):
+            cpf = f"{i:011d}"
+            sistema.cadastrar_cliente(cpf, f"Cliente {i}", "01/01/1990", "Rua A, 1 - Centro - Suzano/SP")
+            sistema.cadastrar_conta_corrente(cpf)
+
+def criar_sistema(qtd_contas: int, **kwargs) -> SistemaBancario:
+    sistema = SistemaBancario(**kwargs)
+    cadastrar_contas(sistema, qtd_contas)
+    return sistema
+
+# Benchmark: idempotência
+def benchmark_idempotencia(operacoes: int = 50000):
+    print("\n🔁 IDEMPOTÊNCIA")
+
+    # Custo adicional por operação: depósito sem chave x com chave nova
+    sistema = criar_sistema(1)
+    with silenciar():
+        sem_chave = medir(lambda: sistema.depositar(1, 10.0), operacoes)
+        contador = iter(range(operacoes))
+        com_chave = medir(lambda: sistema.depositar(1, 10.0, f"dep-{next(contador)}"), operacoes)
+    print(f"   Depósito sem chave: {sem_chave:.2f} µs/op")
+    print(f"   Depósito com chave: {com_chave:.2f} µs/op (+{com_chave - sem_chave:.2f} µs)")
+
+    # Tempestade de retries: cada requisição é repetida algumas vezes
+    capacidade = 1000
+    sistema = criar_sistema(1, cache_idempotencia=CacheIdempotencia(capacidade=capacidade))
+    rng = random.Random(42)
+    requisicoes = []
+    for i in range(operacoes // 4):
+        requisicoes.extend([f"req-{i}"] * rng.randint(1, 7))
+
+    inicio = time.perf_counter()
+    with silenciar():
+        for chave in requisicoes:
+            sistema.depositar(1, 1.0, chave)
+    duracao = time.perf_counter() - inicio
+
+    cache = sistema.cache_idempotencia
+    conta = sistema.encontrar_conta_por_numero(1)
+    print(f"   Retry storm: {len(requisicoes)} requisições em {duracao:.3f}s "
+          f"({len(requisicoes) / duracao:,.0f} req/s)")
+    print(f"   Acertos: {cache.acertos} | Faltas: {cache.faltas} | Conflitos: {cache.conflitos} | "
+          f"Entradas no cache: {len(cache)}/{capacidade}")
+    print(f"   Depósitos efetivados: {len(conta.historico.transacoes)} (esperado {operacoes // 4})")
+
+# Benchmark: projeções x varredura de todas as contas
+def benchmark_projecoes(qtd_contas: int = 5000, consultas: int = 200, contas_indice: int = 1000000):
+    print("\n📊 PROJEÇÕES")
+
+    sistema = criar_sistema(0)
+    saldos = ProjecaoSaldos()
+    limite = ProjecaoLimiteDiario()
+    totais = ProjecaoTotaisCliente()
+    for projecao in (saldos, limite, totais):
+        sistema.assinar_eventos(projecao.aplicar)
+
+    rng = random.Random(42)
+    inicio = time.perf_counter()
+    with silenciar():
+        for i in range(qtd_contas):
+            cpf = f"{i:011d}"
+            sistema.cadastrar_cliente(cpf, f"Cliente {i}", "01/01/1990", "Rua A, 1 - Centro - Suzano/SP")
+            sistema.cadastrar_conta_corrente(cpf)
+            sistema.depositar(i + 1, float(rng.randint(1, 10000)))
+            for _ in range(rng.randint(0, 3)):
+                sistema.sacar(i + 1, 10.0)
+    print(f"   Carga com projeções: {qtd_contas} contas em {time.perf_counter() - inicio:.3f}s")
+
+    corte = 9000.0
+    varredura = medir(lambda: [c.numero for c in sistema.contas if c.saldo > corte], consultas)
+    indice = medir(lambda: saldos.contas_com_saldo_acima(corte), consultas)
+    print(f"   Saldo acima de R$ {corte:.2f}: varredura {varredura:.1f} µs | índice {indice:.1f} µs")
+
+    varredura = medir(lambda: [c.numero for c in sistema.contas if c.saques_hoje >= c.limite_saques], consultas)
+    indice = medir(lambda: limite.contas_no_limite(), consultas)
+    print(f"   Contas no limite diário: varredura {varredura:.1f} µs | projeção {indice:.1f} µs")
+
+    esperado = sorted(c.numero for c in sistema.contas if c.saldo > corte)
+    assert sorted(saldos.contas_com_saldo_acima(corte)) == esperado
+    assert limite.contas_no_limite() == {c.numero for c in sistema.contas if c.saques_hoje >= c.limite_saques}
+
+    # Virada do dia: o primeiro evento do dia seguinte (um depósito) não pode manter a conta no limite
+    numero = next(iter(limite.contas_no_limite()))
+    conta = sistema.encontrar_conta_por_numero(numero)
+    conta._ultima_data -= datetime.timedelta(days=1)
+    with silenciar():
+        sistema.depositar(numero, 1.0)
+    assert numero not in limite.contas_no_limite()
+
+    # Custo de cada evento no índice de saldos (roda dentro do depósito/saque) com muitas contas
+    indice_grande = ProjecaoSaldos()
+    agora = datetime.datetime.now()
+    for numero in range(contas_indice):
+        indice_grande.aplicar(EventoTransacao('Abertura', numero, "", 0.0, rng.uniform(0, 10000), 0, 0, agora))
+    eventos = [EventoTransacao('Deposito', rng.randrange(contas_indice), "", 0.0, rng.uniform(0, 10000), 0, 0, agora)
+               for _ in range(100000)]
+    inicio = time.perf_counter()
+    for evento in eventos:
+        indice_grande.aplicar(evento)
+    por_evento = (time.perf_counter() - inicio) / len(eventos) * 1e6
+    print(f"   Índice de saldos com {contas_indice} contas: {por_evento:.1f} µs por evento")
+
+# Benchmark: inicialização a partir de snapshot
+def benchmark_inicializacao(qtd_contas: int = 1000000, caminho: str = "benchmark_snapshot.bin"):
+    print("\n🚀 INICIALIZAÇÃO")
+
+    inicio = time.perf_counter()
+    sistema = criar_sistema(qtd_contas)
+    with silenciar():
+        for numero in range(1, qtd_contas + 1, 10):
+            sistema.depositar(numero, 100.0)
+    print(f"   Cadastro completo de {qtd_contas} contas: {time.perf_counter() - inicio:.3f}s")
+
+    inicio = time.perf_counter()
+    salvar_snapshot(sistema, caminho)
+    print(f"   Snapshot gravado em {time.perf_counter() - inicio:.3f}s "
+          f"({os.path.getsize(caminho) / 1e6:.1f} MB)")
+    del sistema
+
+    try:
+        inicio = time.perf_counter()
+        restaurado = restaurar_snapshot(caminho)
+        restaurado_em = time.perf_counter() - inicio
+        with silenciar():
+            restaurado.depositar(qtd_contas, 1.0)
+        primeira_transacao = time.perf_counter() - inicio
+    finally:
+        os.remove(caminho)
+
+    print(f"   Restauração: {restaurado_em:.3f}s | "
+          f"tempo até a primeira transação: {primeira_transacao:.3f}s")
+
+    inicio = time.perf_counter()
+    assert len(restaurado.contas) == qtd_contas
+    print(f"   Montagem de todas as contas (primeira listagem): {time.perf_counter() - inicio:.3f}s")
+
+# Benchmark: motor de limites
+def benchmark_limites(verificacoes: int = 1000000, qtd_contas: int = 1000):
+    print("\n🚦 LIMITES")
+
+    relogio = [0.0]
+
+    def novo_motor() -> MotorLimites:
+        return MotorLimites([
+            LimitePorOperacao(500.0),
+            LimiteJanela(60, max_operacoes=10),
+            LimiteJanela(3600, max_valor=5000.0),
+            LimiteJanela(86400, max_operacoes=50, escopo='cliente'),
+        ], relogio=lambda: relogio[0])
+
+    sistema = criar_sistema(qtd_contas)
+    contas = sistema.contas
+    rng = random.Random(42)
+    sequencia = [(contas[rng.randrange(qtd_contas)], rng.uniform(1, 600)) for _ in range(10000)]
+
+    def rodar(motor: MotorLimites) -> int:
+        # Mesmo caminho usado por SistemaBancario._processar_transacao: uma única
+        # ida ao lock do motor por operação (reservar)
+        reservar = motor.reservar
+        aprovadas = 0
+        for i in range(verificacoes):
+            conta, valor = sequencia[i % 10000]
+            relogio[0] = i * 0.001
+            violacao, _ = reservar(conta, 'Saque', valor)
+            if violacao is None:
+                aprovadas += 1
+        return aprovadas
+
+    inicio = time.perf_counter()
+    aprovadas = rodar(novo_motor())
+    duracao = time.perf_counter() - inicio
+
+    # Uma segunda execução, fora da medição, conta quantas políticas foram de fato
+    # avaliadas (o motor para na primeira violação)
+    avaliacoes = [0]
+    motor_contado = novo_motor()
+    for politica in motor_contado._politicas:
+        def contar(chave, valor, agora, verificar=politica.verificar):
+            avaliacoes[0] += 1
+            return verificar(chave, valor, agora)
+        politica.verificar = contar
+    rodar(motor_contado)
+
+    print(f"   {verificacoes} reservas (4 políticas) em {duracao:.3f}s | aprovadas: {aprovadas}")
+    print(f"   {verificacoes / duracao:,.0f} reservas/s | {avaliacoes[0] / duracao:,.0f} avaliações de política/s "
+          f"({avaliacoes[0] / verificacoes:.2f} por reserva)")
+
+    # Custo do motor dentro do fluxo completo de saque
+    sistema_com_motor = criar_sistema(1, motor_limites=MotorLimites([LimiteJanela(1, max_operacoes=10**9)]))
+    sistema_sem_motor = criar_sistema(1)
+    for s in (sistema_com_motor, sistema_sem_motor):
+        s.encontrar_conta_por_numero(1)._limite_saques = 10**9
+        with silenciar():
+            s.depositar(1, 1e12)
+    with silenciar():
+        sem_motor = medir(lambda: sistema_sem_motor.sacar(1, 1.0), 50000)
+        com_motor = medir(lambda: sistema_com_motor.sacar(1, 1.0), 50000)
+    print(f"   Saque sem motor: {sem_motor:.2f} µs/op | com motor: {com_motor:.2f} µs/op")
+
+    # Saques concorrentes não podem passar do limite da janela, e os recusados
+    # por saldo não podem ocupar vaga
+    sistema_concorrente = criar_sistema(1, motor_limites=MotorLimites([LimiteJanela(3600, max_operacoes=20)]))
+    sistema_concorrente.encontrar_conta_por_numero(1)._limite_saques = 10**9
+    with silenciar():
+        sistema_concorrente.depositar(1, 1000.0)
+        assert not sistema_concorrente.sacar(1, 5000.0)
+        threads = [threading.Thread(target=lambda: [sistema_concorrente.sacar(1, 1.0) for _ in range(50)])
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    saques = sum(1 for t in sistema_concorrente.encontrar_conta_por_numero(1).historico.transacoes
+                 if t['tipo'] == 'Saque')
+    assert saques == 20, saques
+    print(f"   {len(threads)} threads x 50 saques com limite de 20 por janela: {saques} efetivados")
+
+# Benchmark: juros em lote x laço sequencial
+class JurosInterrompido(JurosSobreSaldo):
+    """JurosSobreSaldo (mesma identificação no checkpoint) que falha depois de `contas` cálculos."""
+    def __init__(self, taxa: float, contas: int):
+        super().__init__(taxa)
+        self._restantes = contas
+
+    def identificacao(self) -> str:
+        return JurosSobreSaldo(self._taxa).identificacao()
+
+    def calcular(self, saldo: float, conta_corrente: bool):
+        self._restantes -= 1
+        if self._restantes < 0:
+            raise RuntimeError("job interrompido")
+        return super().calcular(saldo, conta_corrente)
+
+def benchmark_lote(qtd_contas: int = 1000000, taxa: float = 0.01, contas_checkpoint: int = 20000):
+    print("\n🧮 PROCESSAMENTO EM LOTE")
+
+    sistema = criar_sistema(qtd_contas)
+    for conta in sistema.contas:
+        conta._saldo = 1000.0
+
+    # Linha de base com o mesmo caminho de aplicação do JobLote (aplicar_lancamento),
+    # sem blocos nem pool: a diferença medida é só a do particionamento e do executor
+    regra = JurosSobreSaldo(taxa)
+    inicio = time.perf_counter()
+    data = datetime.datetime.now()
+    for conta in sistema.contas:
+        resultado = regra.calcular(conta.saldo, True)
+        if resultado is not None:
+            conta.aplicar_lancamento(resultado[0], resultado[1], data)
+    sequencial = time.perf_counter() - inicio
+    print(f"   Laço sequencial (aplicar_lancamento): {sequencial:.3f}s")
+
+    for executor in ('thread', 'processo'):
+        inicio = time.perf_counter()
+        JobLote(sistema, JurosSobreSaldo(taxa), tamanho_bloco=50000, executor=executor).executar()
+        duracao = time.perf_counter() - inicio
+        print(f"   JobLote ({executor}): {duracao:.3f}s ({sequencial / duracao:.2f}x)")
+
+    # Checkpoint: interrupção real no meio do job, retomada na mesma sessão e
+    # depois de restaurar o snapshot anterior ao job, e job concluído rodando de novo
+    caminho = "benchmark_checkpoint.json"
+    caminho_snapshot = "benchmark_checkpoint.snap"
+    bloco = max(1, contas_checkpoint // 10)
+    esperado = 1000.0 + round(1000.0 * taxa, 2)
+
+    def sistema_antes_do_job() -> SistemaBancario:
+        novo = criar_sistema(contas_checkpoint)
+        for conta in novo.contas:
+            conta._saldo = 1000.0
+        return novo
+
+    def job(alvo: SistemaBancario, regra: RegraLote, id_job: str) -> JobLote:
+        return JobLote(alvo, regra or JurosSobreSaldo(taxa), tamanho_bloco=bloco, workers=1,
+                       checkpoint=caminho, id_job=id_job)
+
+    def interromper(alvo: SistemaBancario, id_job: str) -> int:
+        try:
+            job(alvo, JurosInterrompido(taxa, contas_checkpoint // 2), id_job).executar()
+        except RuntimeError:
+            pass
+        return sum(1 for conta in alvo.contas if conta.saldo != 1000.0)
+
+    def conferir(alvo: SistemaBancario):
+        for conta in alvo.contas:
+            assert conta.saldo == esperado and len(conta.historico.transacoes) == 1, conta.numero
+
+    try:
+        # 1) Interrompido e retomado no mesmo processo: os blocos já aplicados são pulados
+        mesmo_processo = sistema_antes_do_job()
+        parcial = interromper(mesmo_processo, "juros_1")
+        assert 0 < parcial < contas_checkpoint
+        retomada = job(mesmo_processo, JurosSobreSaldo(taxa), "juros_1").executar()
+        conferir(mesmo_processo)
+        print(f"   Interrompido com {parcial}/{contas_checkpoint} contas lançadas; "
+              f"retomada no mesmo processo lançou {retomada}")
+
+        # 2) Interrompido, processo "cai" e o sistema volta do snapshot tirado antes do job:
+        #    os blocos do diário são reaplicados e o resto é calculado
+        antes = sistema_antes_do_job()
+        salvar_snapshot(antes, caminho_snapshot)
+        parcial = interromper(antes, "juros_2")
+        assert 0 < parcial < contas_checkpoint
+        restaurado = restaurar_snapshot(caminho_snapshot)
+        retomada = job(restaurado, JurosSobreSaldo(taxa), "juros_2").executar()
+        conferir(restaurado)
+        print(f"   Interrompido com {parcial} contas lançadas; retomada após restaurar o snapshot "
+              f"anterior lançou {retomada}")
+
+        # 3) Job concluído, snapshot depois dele, restauração e o mesmo job de novo: nada é lançado
+        salvar_snapshot(restaurado, caminho_snapshot)
+        depois = restaurar_snapshot(caminho_snapshot)
+        repeticao = job(depois, JurosSobreSaldo(taxa), "juros_2").executar()
+        conferir(depois)
+        assert repeticao == 0 and not os.path.exists(caminho + ".lancamentos")
+        print(f"   Job concluído rodando de novo: {repeticao} lançamentos (diário removido)")
+
+        # 4) Checkpoint inacabado de outro job é recusado
+        interromper(sistema_antes_do_job(), "juros_4")
+        try:
+            job(sistema_antes_do_job(), JurosSobreSaldo(taxa), "juros_mes_seguinte").executar()
+            outro_job = "aceito"
+        except ValueError:
+            outro_job = "recusado"
+        print(f"   Checkpoint inacabado de outro job: {outro_job}")
+    finally:
+        for arquivo in (caminho, caminho + ".lancamentos", caminho_snapshot):
+            if os.path.exists(arquivo):
+                os.remove(arquivo)
+
+# Benchmark: codec binário x pickle x JSON
+def benchmark_codec(qtd_transacoes: int = 200000, qtd_contas: int = 20000):
+    print("\n📦 CODEC BINÁRIO")
+
+    sistema = criar_sistema(1)
+    conta = sistema.encontrar_conta_por_numero(1)
+    rng = random.Random(42)
+    agora = time.time()
+    for i in range(qtd_transacoes):
+        tipo = 'Deposito' if rng.random() < 0.6 else 'Saque'
+        conta.historico.adicionar_lancamento(tipo, round(rng.uniform(1, 500), 2),
+                                             datetime.datetime.fromtimestamp(agora + i))
+    transacoes = conta.historico.transacoes
+    registros = registros_da_conta(conta)
+
+    def json_codificar():
+        return json.dumps([{'tipo': t['tipo'], 'valor': t['valor'], 'data': t['data'].isoformat()}
+                           for t in transacoes]).encode()
+
+    def json_decodificar(dados):
+        return [{'tipo': t['tipo'], 'valor': t['valor'], 'data': datetime.datetime.fromisoformat(t['data'])}
+                for t in json.loads(dados)]
+
+    formatos = [
+        ("struct", lambda: codificar_transacoes(registros), lambda dados: list(decodificar_transacoes(dados))),
+        ("pickle", lambda: pickle.dumps(transacoes, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ("json", json_codificar, json_decodificar),
+    ]
+    assert list(decodificar_transacoes(codificar_transacoes(registros))) == registros
+
+    print(f"   Transações ({qtd_transacoes} registros):")
+    for nome, codificar, decodificar in formatos:
+        inicio = time.perf_counter()
+        dados = codificar()
+        codificacao = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        decodificar(dados)
+        decodificacao = time.perf_counter() - inicio
+        print(f"     {nome:7} {len(dados) / qtd_transacoes:6.1f} bytes/registro | "
+              f"codifica {qtd_transacoes / codificacao:12,.0f} reg/s | "
+              f"decodifica {qtd_transacoes / decodificacao:12,.0f} reg/s")
+
+    sistema = criar_sistema(qtd_contas)
+    contas = sistema.contas
+    contas[0]._limite_saques = 10**9
+    contas[1]._agencia = "12"
+    dados = codificar_contas(contas)
+    inicio = time.perf_counter()
+    decodificados = sum(1 for _ in decodificar_contas(dados))
+    decodificacao = time.perf_counter() - inicio
+
+    # Ida e volta: os valores decodificados são os mesmos da conta, sem truncar nem sobrar preenchimento
+    for conta, registro in zip(contas, decodificar_contas(dados)):
+        assert registro == (conta.numero, conta.agencia, True, conta.saldo, conta.limite, conta.limite_saques,
+                            conta.saques_hoje, conta._ultima_data.toordinal(), conta.cliente.cpf), registro
+    for campo, valor in (('_agencia', "00001"), ('_limite_saques', 2**32)):
+        original = getattr(contas[0], campo)
+        setattr(contas[0], campo, valor)
+        try:
+            codificar_contas(contas[:1])
+            raise AssertionError(f"{campo}={valor!r} deveria ser recusado")
+        except ValueError:
+            pass
+        finally:
+            setattr(contas[0], campo, original)
+    print(f"   Contas ({qtd_contas}): struct {len(dados) / qtd_contas:.1f} bytes/conta "
+          f"(pickle {len(pickle.dumps(contas, protocol=pickle.HIGHEST_PROTOCOL)) / qtd_contas:.1f}) | "
+          f"decodifica {decodificados / decodificacao:,.0f} contas/s")
+
+# Benchmark: escritores x relatórios (visões de leitura x lock)
+def _relatorios_na_replica(eventos, resultados, qtd_contas: int):
+    """Processo de relatórios: mantém uma ReplicaLeitura com os eventos recebidos e roda os relatórios nela."""
+    # Relatório é trabalho de fundo: com poucos núcleos, o escritor tem prioridade na CPU
+    if hasattr(os, 'nice'):
+        os.nice(19)
+    replica = ReplicaLeitura()
+    rng = random.Random(2)
+    relatorios = 0
+    while True:
+        try:
+            # Aplica tudo o que já chegou antes do próximo relatório
+            while True:
+                lote = eventos.get_nowait()
+                if lote is None:
+                    visao = replica.capturar_visao()
+                    resultados.put((relatorios, {numero: visao.saldo(numero) for numero in visao.numeros_contas()}))
+                    return
+                replica.alimentar(lote)
+        except queue.Empty:
+            pass
+        # Mesmo trabalho dos leitores em thread: lista todas as contas e um extrato
+        visao = replica.capturar_visao()
+        linhas = [f"Conta {numero}: R$ {visao.saldo(numero):.2f}" for numero in visao.numeros_contas()]
+        linhas += [f"{tipo}: R$ {valor:.2f}" for tipo, valor, _ in visao.transacoes(rng.randint(1, qtd_contas))]
+        relatorios += 1
+
+def benchmark_leitura(qtd_contas: int = 2000, duracao: float = 2.0, leitores: int = 2, lote_eventos: int = 256):
+    print("\n📖 VISÕES DE LEITURA")
+
+    def rodar(modo: str) -> Tuple[float, float]:
+        sistema = SistemaBancario()
+        replica = ReplicaLeitura()
+        if modo == 'replica':
+            # Os eventos saem em lotes por uma fila para a réplica em outro processo
+            contexto = multiprocessing.get_context()
+            eventos, resultados = contexto.Queue(), contexto.Queue()
+            pendentes: List[EventoTransacao] = []
+
+            def enviar(evento: EventoTransacao):
+                pendentes.append(evento)
+                if len(pendentes) >= lote_eventos:
+                    eventos.put(pendentes[:])
+                    pendentes.clear()
+            sistema.assinar_eventos(enviar)
+            processo = contexto.Process(target=_relatorios_na_replica, args=(eventos, resultados, qtd_contas))
+            processo.start()
+        else:
+            sistema.assinar_eventos(replica.aplicar)
+        cadastrar_contas(sistema, qtd_contas)
+        lock = threading.Lock()
+        parar = threading.Event()
+        operacoes = [0]
+        relatorios = [0]
+
+        def escritor():
+            rng = random.Random(1)
+            while not parar.is_set():
+                numero = rng.randint(1, qtd_contas)
+                if modo == 'lock':
+                    with lock:
+                        sistema.depositar(numero, 10.0)
+                else:
+                    sistema.depositar(numero, 10.0)
+                operacoes[0] += 1
+
+        def leitor():
+            rng = random.Random(2)
+            while not parar.is_set():
+                if modo == 'lock':
+                    with lock:
+                        sistema.listar_contas()
+                        sistema.extrato(rng.randint(1, qtd_contas))
+                else:
+                    visao = sistema.capturar_visao()
+                    sistema.listar_contas(visao)
+                    sistema.extrato(rng.randint(1, qtd_contas), visao)
+                relatorios[0] += 1
+
+        threads = [threading.Thread(target=escritor)]
+        if modo in ('visao', 'lock'):
+            threads += [threading.Thread(target=leitor) for _ in range(leitores)]
+        with silenciar():
+            for thread in threads:
+                thread.start()
+            time.sleep(duracao)
+            parar.set()
+            for thread in threads:
+                thread.join()
+
+        if modo == 'replica':
+            eventos.put(pendentes[:])
+            eventos.put(None)
+            relatorios[0], saldos = resultados.get()
+            processo.join()
+            assert all(saldos.get(conta.numero) == conta.saldo for conta in sistema.contas)
+        else:
+            # A réplica, alimentada só pelos eventos, deve bater com o sistema
+            visao = replica.capturar_visao()
+            assert all(visao.saldo(conta.numero) == conta.saldo for conta in sistema.contas)
+        return operacoes[0] / duracao, relatorios[0] / duracao
+
+    sozinho, _ = rodar('sozinho')
+    print(f"   Escritor sozinho:                        {sozinho:12,.0f} depósitos/s")
+    for modo, descricao in (('visao', f"+ {leitores} leitores com visão"),
+                            ('lock', f"+ {leitores} leitores com lock global"),
+                            ('replica', "+ relatórios na réplica (outro processo)")):
+        escrita, leitura = rodar(modo)
+        print(f"   {descricao + ':':40} {escrita:12,.0f} depósitos/s ({escrita / sozinho:.0%}) | "
+              f"{leitura:,.1f} relatórios/s")
+
+BENCHMARKS = {
+    "idempotencia": benchmark_idempotencia,
+    "projecoes": benchmark_projecoes,
+    "inicializacao": benchmark_inicializacao,
+    "limites": benchmark_limites,
+    "lote": benchmark_lote,
+    "codec": benchmark_codec,
+    "leitura": benchmark_leitura,
+}
+
+def main():
+    nomes = sys.argv[1:] or list(BENCHMARKS)
+    for nome in nomes:
+        if nome not in BENCHMARKS:
+            print(f"❌ Benchmark desconhecido: {nome}. Opções: {', '.join(BENCHMARKS)}")
+            continue
+        BENCHMARKS[nome]()
+
+if __name__ == "__main__":
+    main()
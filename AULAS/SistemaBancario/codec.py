@@ -0,0 +1,116 @@
+import datetime
+import struct
+from typing import Iterable, Iterator, List, Tuple
+
+from SistemaBancarioFinal import Conta, ContaCorrente
+
+# Formato binário compacto para transações (Deposito/Saque) e estado de contas
+#
+# Cada lote começa com um cabeçalho fixo, seguido de registros de tamanho fixo:
+#
+#   cabeçalho   magico '4s' | versão 'H' | tipo de registro 'H' | quantidade 'I'
+#   transação   conta 'I' | tipo 'B' | valor 'd' | data (timestamp) 'd'
+#   conta       número 'I' | agência '4s' | corrente '?' | saldo 'd' | limite 'd'
+#               | limite de saques 'I' | saques hoje 'I' | última data (ordinal) 'i' | cpf '11s'
+#
+# Todos os campos são little-endian e sem alinhamento ('<'). A decodificação
+# percorre o buffer com struct.iter_unpack sobre um memoryview, sem copiar os bytes.
+# Valores que não cabem no campo (texto longo demais, número fora da faixa)
+# geram ValueError na codificação em vez de serem truncados.
+
+MAGICO = b"SBCD"
+VERSAO = 2
+REGISTRO_TRANSACAO = 1
+REGISTRO_CONTA = 2
+
+CABECALHO = struct.Struct("<4sHHI")
+TRANSACAO = struct.Struct("<IBdd")
+CONTA = struct.Struct("<I4s?ddIIi11s")
+TAMANHO_AGENCIA = 4
+TAMANHO_CPF = 11
+
+TIPOS = {'Deposito': 1, 'Saque': 2}
+NOMES_TIPOS = {codigo: nome for nome, codigo in TIPOS.items()}
+
+RegistroTransacao = Tuple[int, int, float, float]
+
+def _codificar(estrutura: struct.Struct, tipo_registro: int, registros: List[tuple]) -> bytes:
+    buffer = bytearray(CABECALHO.size + estrutura.size * len(registros))
+    CABECALHO.pack_into(buffer, 0, MAGICO, VERSAO, tipo_registro, len(registros))
+    empacotar = estrutura.pack_into
+    posicao = CABECALHO.size
+    tamanho = estrutura.size
+    for indice, registro in enumerate(registros):
+        try:
+            empacotar(buffer, posicao, *registro)
+        except struct.error as erro:
+            raise ValueError(f"Registro {indice} fora da faixa do formato {estrutura.format!r}: {erro}.") from None
+        posicao += tamanho
+    return bytes(buffer)
+
+def _registros(buffer, estrutura: struct.Struct, tipo_registro: int) -> memoryview:
+    visao = memoryview(buffer)
+    if len(visao) < CABECALHO.size:
+        raise ValueError("Buffer menor que o cabeçalho.")
+    magico, versao, tipo, quantidade = CABECALHO.unpack_from(visao)
+    if magico != MAGICO:
+        raise ValueError("Buffer não está no formato do sistema bancário.")
+    if versao != VERSAO:
+        raise ValueError(f"Versão do formato não suportada: {versao}.")
+    if tipo != tipo_registro:
+        raise ValueError(f"Tipo de registro inesperado: {tipo}.")
+    fim = CABECALHO.size + quantidade * estrutura.size
+    if len(visao) < fim:
+        raise ValueError("Buffer truncado.")
+    return visao[CABECALHO.size:fim]
+
+# Transações
+def registros_da_conta(conta: Conta) -> List[RegistroTransacao]:
+    """Converte o Historico de uma conta em registros (conta, tipo, valor, timestamp)."""
+    numero = conta.numero
+    return [(numero, TIPOS[transacao['tipo']], transacao['valor'], transacao['data'].timestamp())
+            for transacao in conta.historico.transacoes]
+
+def codificar_transacoes(registros: List[RegistroTransacao]) -> bytes:
+    return _codificar(TRANSACAO, REGISTRO_TRANSACAO, registros)
+
+def decodificar_transacoes(buffer) -> Iterator[RegistroTransacao]:
+    """Itera sobre os registros (conta, tipo, valor, timestamp) sem copiar o buffer."""
+    return TRANSACAO.iter_unpack(_registros(buffer, TRANSACAO, REGISTRO_TRANSACAO))
+
+def como_transacao(registro: RegistroTransacao) -> dict:
+    """Converte um registro decodificado para o formato usado pelo Historico."""
+    _, tipo, valor, data = registro
+    return {'tipo': NOMES_TIPOS[tipo], 'valor': valor, 'data': datetime.datetime.fromtimestamp(data)}
+
+# Contas
+def _texto(valor: str, tamanho: int, campo: str) -> bytes:
+    codificado = valor.encode()
+    if len(codificado) > tamanho:
+        raise ValueError(f"{campo} '{valor}' não cabe em {tamanho} bytes.")
+    return codificado
+
+def _registro_conta(conta: Conta) -> tuple:
+    agencia = _texto(conta.agencia, TAMANHO_AGENCIA, "Agência")
+    cpf = conta.cliente.cpf.encode()
+    if len(cpf) != TAMANHO_CPF:
+        raise ValueError(f"CPF '{conta.cliente.cpf}' deve ter {TAMANHO_CPF} dígitos.")
+    if isinstance(conta, ContaCorrente):
+        return (conta.numero, agencia, True, conta.saldo, conta.limite,
+                conta.limite_saques, conta.saques_hoje, conta._ultima_data.toordinal(), cpf)
+    return (conta.numero, agencia, False, conta.saldo, 0.0, 0, 0, 0, cpf)
+
+def codificar_contas(contas: Iterable[Conta]) -> bytes:
+    return _codificar(CONTA, REGISTRO_CONTA, [_registro_conta(conta) for conta in contas])
+
+def decodificar_contas(buffer) -> Iterator[tuple]:
+    """
+    Itera sobre (número, agência, corrente, saldo, limite, limite_saques,
+    saques_hoje, última data ordinal, cpf). Agência e CPF vêm como str, sem o
+    preenchimento com bytes nulos.
+    """
+    registros = CONTA.iter_unpack(_registros(buffer, CONTA, REGISTRO_CONTA))
+    return ((numero, agencia.rstrip(b"\0").decode(), corrente, saldo, limite, limite_saques,
+             saques_hoje, ultima_data, cpf.rstrip(b"\0").decode())
+            for numero, agencia, corrente, saldo, limite, limite_saques, saques_hoje, ultima_data, cpf
+            in registros)
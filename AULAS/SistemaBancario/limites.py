@@ -0,0 +1,231 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Motor de limites (rate limit / velocidade de fraude)
+#
+# Generaliza os limites fixos de ContaCorrente (quantidade de saques por dia
+# e valor máximo por saque) para políticas configuráveis, avaliadas antes de
+# cada transação pelo SistemaBancario:
+#
+#     motor = MotorLimites([
+#         LimiteJanela(60, max_operacoes=5, tipos=('Saque',)),
+#         LimiteJanela(86400, max_valor=5000.0, escopo='cliente', tipos=('Saque',)),
+#     ])
+#     sistema = SistemaBancario(motor_limites=motor)
+#
+# A verificação e o registro acontecem juntos, sob o lock do motor
+# (`reservar`): a operação já conta no limite antes de ser executada e, se
+# falhar, a reserva é desfeita (`cancelar`). Assim duas threads sacando ao
+# mesmo tempo não passam as duas pela última vaga da janela.
+
+ESCOPOS = ('conta', 'cliente')
+
+class PoliticaLimite(ABC):
+    def __init__(self, escopo: str = 'conta', tipos: Tuple[str, ...] = ('Saque',)):
+        if escopo not in ESCOPOS:
+            raise ValueError(f"Escopo inválido: {escopo}. Use {' ou '.join(ESCOPOS)}.")
+        self._escopo = escopo
+        self._tipos = tipos
+
+    @property
+    def escopo(self) -> str:
+        return self._escopo
+
+    def aplica_se(self, tipo: str) -> bool:
+        return tipo in self._tipos
+
+    @abstractmethod
+    def verificar(self, chave, valor: float, agora: float) -> Optional[str]:
+        """Retorna a mensagem de erro se a operação violar o limite, ou None."""
+
+    @abstractmethod
+    def registrar(self, chave, valor: float, agora: float):
+        """Contabiliza uma operação que foi efetivada."""
+
+    @abstractmethod
+    def cancelar(self, chave, valor: float, agora: float):
+        """Desfaz um `registrar` feito no instante `agora` (operação que não foi efetivada)."""
+
+# Limite por operação (equivalente ao `_limite` de ContaCorrente)
+class LimitePorOperacao(PoliticaLimite):
+    def __init__(self, valor_maximo: float, escopo: str = 'conta', tipos: Tuple[str, ...] = ('Saque',)):
+        super().__init__(escopo, tipos)
+        self._valor_maximo = valor_maximo
+
+    def verificar(self, chave, valor: float, agora: float) -> Optional[str]:
+        if valor > self._valor_maximo:
+            return f"O valor máximo por operação é R$ {self._valor_maximo:.2f}."
+        return None
+
+    def registrar(self, chave, valor: float, agora: float):
+        pass
+
+    def cancelar(self, chave, valor: float, agora: float):
+        pass
+
+class _Janela:
+    """Contadores de uma chave em um buffer circular de baldes de tempo."""
+    __slots__ = ('balde_atual', 'quantidade', 'valor', 'quantidades', 'valores')
+
+    def __init__(self, baldes: int, balde_atual: int):
+        self.balde_atual = balde_atual
+        self.quantidade = 0
+        self.valor = 0.0
+        self.quantidades = [0] * baldes
+        self.valores = [0.0] * baldes
+
+# Janela deslizante (quantidade e/ou valor acumulado em um período)
+class LimiteJanela(PoliticaLimite):
+    """
+    Limita a quantidade de operações e/ou o valor acumulado dentro de uma janela
+    deslizante de `janela_segundos`. A janela é dividida em `baldes` intervalos
+    guardados em um buffer circular, com os totais mantidos à parte: cada
+    verificação custa O(1) amortizado, sem percorrer o histórico da conta.
+    """
+    def __init__(self, janela_segundos: float, max_operacoes: Optional[int] = None,
+                 max_valor: Optional[float] = None, baldes: int = 60,
+                 escopo: str = 'conta', tipos: Tuple[str, ...] = ('Saque',)):
+        super().__init__(escopo, tipos)
+        if max_operacoes is None and max_valor is None:
+            raise ValueError("Informe max_operacoes e/ou max_valor.")
+        self._janela = janela_segundos
+        self._max_operacoes = max_operacoes
+        self._max_valor = max_valor
+        self._baldes = baldes
+        self._largura_balde = janela_segundos / baldes
+        self._janelas: Dict[object, _Janela] = {}
+
+    def _janela_atualizada(self, chave, agora: float) -> _Janela:
+        balde = int(agora // self._largura_balde)
+        janela = self._janelas.get(chave)
+        if janela is None:
+            janela = self._janelas[chave] = _Janela(self._baldes, balde)
+            return janela
+
+        avanco = balde - janela.balde_atual
+        if avanco <= 0:
+            return janela
+        if avanco >= self._baldes:
+            # Toda a janela expirou
+            janela.quantidade = 0
+            janela.valor = 0.0
+            janela.quantidades = [0] * self._baldes
+            janela.valores = [0.0] * self._baldes
+        else:
+            # Descarta apenas os baldes que saíram da janela
+            for passo in range(1, avanco + 1):
+                indice = (janela.balde_atual + passo) % self._baldes
+                janela.quantidade -= janela.quantidades[indice]
+                janela.valor -= janela.valores[indice]
+                janela.quantidades[indice] = 0
+                janela.valores[indice] = 0.0
+        janela.balde_atual = balde
+        return janela
+
+    def verificar(self, chave, valor: float, agora: float) -> Optional[str]:
+        janela = self._janela_atualizada(chave, agora)
+        if self._max_operacoes is not None and janela.quantidade >= self._max_operacoes:
+            return f"Limite de {self._max_operacoes} operações em {self._janela:g}s atingido."
+        if self._max_valor is not None and janela.valor + valor > self._max_valor:
+            return f"Limite de R$ {self._max_valor:.2f} em {self._janela:g}s excedido."
+        return None
+
+    def registrar(self, chave, valor: float, agora: float):
+        janela = self._janela_atualizada(chave, agora)
+        indice = janela.balde_atual % self._baldes
+        janela.quantidade += 1
+        janela.valor += valor
+        janela.quantidades[indice] += 1
+        janela.valores[indice] += valor
+
+    def cancelar(self, chave, valor: float, agora: float):
+        janela = self._janelas.get(chave)
+        balde = int(agora // self._largura_balde)
+        if janela is None or janela.balde_atual - balde >= self._baldes:
+            # O balde da reserva já saiu da janela
+            return
+        indice = balde % self._baldes
+        janela.quantidade -= 1
+        janela.valor -= valor
+        janela.quantidades[indice] -= 1
+        janela.valores[indice] -= valor
+
+class Reserva(NamedTuple):
+    """Operação já contabilizada pelo motor, ainda não efetivada."""
+    conta: object
+    tipo: str
+    valor: float
+    agora: float
+
+# Motor que combina as políticas
+class MotorLimites:
+    def __init__(self, politicas: Optional[List[PoliticaLimite]] = None,
+                 relogio: Callable[[], float] = time.monotonic):
+        self._politicas: List[PoliticaLimite] = list(politicas or [])
+        self._relogio = relogio
+        self._lock = threading.Lock()
+        # Políticas que valem para cada tipo, com o escopo já resolvido (True = por conta)
+        self._por_tipo: Dict[str, List[Tuple[PoliticaLimite, bool]]] = {}
+
+    def adicionar_politica(self, politica: PoliticaLimite):
+        with self._lock:
+            self._politicas.append(politica)
+            self._por_tipo.clear()
+
+    def _aplicaveis(self, tipo: str) -> List[Tuple[PoliticaLimite, bool]]:
+        aplicaveis = self._por_tipo.get(tipo)
+        if aplicaveis is None:
+            aplicaveis = self._por_tipo[tipo] = [(politica, politica.escopo == 'conta')
+                                                 for politica in self._politicas if politica.aplica_se(tipo)]
+        return aplicaveis
+
+    @staticmethod
+    def _chaves(aplicaveis: List[Tuple[PoliticaLimite, bool]], conta) -> list:
+        return [conta.numero if por_conta else conta.cliente.cpf for _, por_conta in aplicaveis]
+
+    def verificar(self, conta, tipo: str, valor: float) -> Optional[str]:
+        with self._lock:
+            aplicaveis = self._aplicaveis(tipo)
+            return self._verificar(aplicaveis, self._chaves(aplicaveis, conta), valor, self._relogio())
+
+    def registrar(self, conta, tipo: str, valor: float):
+        with self._lock:
+            aplicaveis = self._aplicaveis(tipo)
+            self._registrar(aplicaveis, self._chaves(aplicaveis, conta), valor, self._relogio())
+
+    def reservar(self, conta, tipo: str, valor: float) -> Tuple[Optional[str], Optional[Reserva]]:
+        """
+        Verifica e contabiliza a operação de uma vez. Retorna (violação, None)
+        se algum limite for violado, ou (None, reserva) se a operação pode seguir.
+        """
+        with self._lock:
+            agora = self._relogio()
+            aplicaveis = self._aplicaveis(tipo)
+            chaves = self._chaves(aplicaveis, conta)
+            violacao = self._verificar(aplicaveis, chaves, valor, agora)
+            if violacao:
+                return violacao, None
+            self._registrar(aplicaveis, chaves, valor, agora)
+            return None, Reserva(conta, tipo, valor, agora)
+
+    def cancelar(self, reserva: Reserva):
+        with self._lock:
+            aplicaveis = self._aplicaveis(reserva.tipo)
+            for (politica, _), chave in zip(aplicaveis, self._chaves(aplicaveis, reserva.conta)):
+                politica.cancelar(chave, reserva.valor, reserva.agora)
+
+    @staticmethod
+    def _verificar(aplicaveis: List[Tuple[PoliticaLimite, bool]], chaves: list,
+                   valor: float, agora: float) -> Optional[str]:
+        for (politica, _), chave in zip(aplicaveis, chaves):
+            violacao = politica.verificar(chave, valor, agora)
+            if violacao:
+                return violacao
+        return None
+
+    @staticmethod
+    def _registrar(aplicaveis: List[Tuple[PoliticaLimite, bool]], chaves: list, valor: float, agora: float):
+        for (politica, _), chave in zip(aplicaveis, chaves):
+            politica.registrar(chave, valor, agora)
@@ -0,0 +1,233 @@
+import datetime
+import json
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set, Tuple
+
+from SistemaBancarioFinal import ContaCorrente, SistemaBancario
+
+# Processamento em lote (juros, tarifas) sobre todas as contas
+#
+# As contas são divididas em blocos. O cálculo de cada bloco roda em um pool
+# de threads ou de processos e devolve apenas os lançamentos (número da conta,
+# tipo, valor). A aplicação nos saldos e no Historico é feita no processo
+# principal, bloco a bloco.
+#
+# Checkpoint: depois de aplicado, cada bloco vai para um diário
+# (`<checkpoint>.lancamentos`) com os lançamentos e, para cada um, a posição
+# em que entrou no histórico da conta (a marca d'água). O checkpoint guarda a
+# identidade do job (id, regra e tamanho de bloco) e se ele terminou. Ao
+# retomar, cada lançamento do diário é conferido na própria conta:
+#   - o histórico tem o lançamento na posição da marca: já aplicado, é pulado;
+#   - o histórico termina na marca (ex: sistema restaurado do snapshot tirado
+#     antes do job): é reaplicado;
+#   - qualquer outra coisa: o estado não é o que o job conheceu, ValueError.
+# Blocos fora do diário são calculados de novo. Um job concluído não faz nada
+# ao rodar de novo, e o diário é apagado ao concluir. Um checkpoint inacabado
+# de outro job (outro id, regra ou tamanho de bloco) é recusado.
+#
+#     job = JobLote(sistema, JurosSobreSaldo(0.005), checkpoint="juros.json", id_job="juros_2026_10")
+#     job.executar()
+
+Lancamento = Tuple[int, str, float]
+
+class RegraLote(ABC):
+    """Regra aplicada a cada conta. Precisa ser serializável (pickle) para o pool de processos."""
+    def identificacao(self) -> str:
+        """Descrição da regra e dos seus parâmetros, gravada no checkpoint."""
+        parametros = ", ".join(f"{nome.lstrip('_')}={valor!r}" for nome, valor in sorted(vars(self).items()))
+        return f"{self.__class__.__name__}({parametros})"
+
+    @abstractmethod
+    def calcular(self, saldo: float, conta_corrente: bool) -> Optional[Tuple[str, float]]:
+        """Retorna (tipo, valor) do lançamento, ou None se nada deve ser lançado."""
+
+class JurosSobreSaldo(RegraLote):
+    def __init__(self, taxa: float):
+        self._taxa = taxa
+
+    def calcular(self, saldo: float, conta_corrente: bool) -> Optional[Tuple[str, float]]:
+        juros = round(saldo * self._taxa, 2)
+        if juros > 0:
+            return ('Deposito', juros)
+        return None
+
+class TarifaContaCorrente(RegraLote):
+    """Cobra a tarifa mensal das contas correntes, limitada ao saldo disponível."""
+    def __init__(self, valor: float):
+        self._valor = valor
+
+    def calcular(self, saldo: float, conta_corrente: bool) -> Optional[Tuple[str, float]]:
+        if not conta_corrente or saldo <= 0:
+            return None
+        return ('Saque', round(min(self._valor, saldo), 2))
+
+def _calcular_bloco(regra: RegraLote, indice: int, bloco: List[Tuple[int, float, bool]]) -> Tuple[int, List[Lancamento]]:
+    lancamentos = []
+    for numero, saldo, conta_corrente in bloco:
+        resultado = regra.calcular(saldo, conta_corrente)
+        if resultado is not None:
+            lancamentos.append((numero, resultado[0], resultado[1]))
+    return indice, lancamentos
+
+class JobLote:
+    def __init__(self, sistema: SistemaBancario, regra: RegraLote, tamanho_bloco: int = 10000,
+                 workers: Optional[int] = None, executor: str = 'thread', checkpoint: Optional[str] = None,
+                 id_job: Optional[str] = None):
+        if executor not in ('thread', 'processo'):
+            raise ValueError("Executor inválido. Use 'thread' ou 'processo'.")
+        if checkpoint and not id_job:
+            raise ValueError("Informe id_job para usar checkpoint (ex: 'juros_2026_10').")
+        self._sistema = sistema
+        self._regra = regra
+        self._tamanho_bloco = tamanho_bloco
+        self._workers = workers
+        self._executor = executor
+        self._checkpoint = checkpoint
+        self._id_job = id_job
+
+    @property
+    def _diario(self) -> str:
+        return self._checkpoint + ".lancamentos"
+
+    def _identidade(self) -> dict:
+        return {'id_job': self._id_job, 'regra': self._regra.identificacao(),
+                'tamanho_bloco': self._tamanho_bloco}
+
+    def _carregar_checkpoint(self) -> Tuple[Optional[Set[int]], int]:
+        """
+        Retorna os blocos já registrados no diário (None se o job já foi
+        concluído) e quantos lançamentos do diário precisaram ser reaplicados.
+        """
+        if not self._checkpoint:
+            return set(), 0
+
+        dados = None
+        if os.path.exists(self._checkpoint):
+            with open(self._checkpoint, encoding='utf-8') as arquivo:
+                dados = json.load(arquivo)
+        identidade = self._identidade()
+        mesmo_job = dados is not None and all(dados.get(campo) == valor for campo, valor in identidade.items())
+        if mesmo_job and dados.get('concluido'):
+            return None, 0
+        if not mesmo_job:
+            if dados is not None and not dados.get('concluido'):
+                campo = next(campo for campo, valor in identidade.items() if dados.get(campo) != valor)
+                raise ValueError(f"Checkpoint pertence a outro job, ainda não concluído "
+                                 f"({campo}: {dados.get(campo)!r}, esperado {identidade[campo]!r}).")
+            # Job novo (ou o checkpoint é de um job anterior já concluído): começa do zero
+            if os.path.exists(self._diario):
+                os.remove(self._diario)
+            self._gravar_checkpoint(concluido=False)
+            return set(), 0
+
+        # Mesmo job, interrompido: confere o diário contra o estado atual das contas
+        blocos = self._ler_diario()
+        reaplicados = 0
+        for lancamentos in blocos.values():
+            reaplicados += self._conferir(lancamentos)
+        return set(blocos), reaplicados
+
+    def _conferir(self, lancamentos: List[tuple]) -> int:
+        """Reaplica os lançamentos do diário que não estão no histórico das contas."""
+        encontrar = self._sistema.encontrar_conta_por_numero
+        data = datetime.datetime.now()
+        reaplicados = 0
+        for numero, tipo, valor, marca in lancamentos:
+            conta = encontrar(numero)
+            transacoes = conta.historico.transacoes if conta is not None else None
+            if transacoes is not None and len(transacoes) > marca:
+                lancado = transacoes[marca]
+                if lancado['tipo'] == tipo and lancado['valor'] == valor:
+                    continue
+            elif transacoes is not None and len(transacoes) == marca:
+                conta.aplicar_lancamento(tipo, valor, data)
+                reaplicados += 1
+                continue
+            raise ValueError(f"Conta {numero} não corresponde ao checkpoint do job '{self._id_job}': "
+                             f"o histórico não tem o lançamento na posição {marca} nem termina nela.")
+        return reaplicados
+
+    def _ler_diario(self) -> Dict[int, List[tuple]]:
+        blocos: Dict[int, List[tuple]] = {}
+        if not os.path.exists(self._diario):
+            return blocos
+        with open(self._diario, encoding='utf-8') as arquivo:
+            for linha in arquivo:
+                if not linha.endswith("\n"):
+                    break  # Escrita interrompida no meio da linha
+                registro = json.loads(linha)
+                blocos[registro['bloco']] = [tuple(lancamento) for lancamento in registro['lancamentos']]
+        return blocos
+
+    def _registrar_bloco(self, indice: int, lancamentos: List[tuple]):
+        if not self._checkpoint:
+            return
+        with open(self._diario, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(json.dumps({'bloco': indice, 'lancamentos': lancamentos}) + "\n")
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+
+    def _concluir(self):
+        if not self._checkpoint:
+            return
+        self._gravar_checkpoint(concluido=True)
+        if os.path.exists(self._diario):
+            os.remove(self._diario)
+
+    def _gravar_checkpoint(self, concluido: bool):
+        # Grava em um arquivo temporário e substitui, para nunca deixar um checkpoint pela metade
+        temporario = self._checkpoint + ".tmp"
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump({**self._identidade(), 'concluido': concluido}, arquivo)
+        os.replace(temporario, self._checkpoint)
+
+    def _blocos(self, concluidos: Set[int]):
+        contas = self._sistema.contas
+        for indice, inicio in enumerate(range(0, len(contas), self._tamanho_bloco)):
+            if indice in concluidos:
+                continue
+            yield indice, [(conta.numero, conta.saldo, isinstance(conta, ContaCorrente))
+                           for conta in contas[inicio:inicio + self._tamanho_bloco]]
+
+    def _aplicar(self, lancamentos: List[Lancamento]) -> List[tuple]:
+        """Aplica os lançamentos e devolve cada um com a sua marca d'água (posição no histórico)."""
+        encontrar = self._sistema.encontrar_conta_por_numero
+        data = datetime.datetime.now()
+        aplicados = []
+        for numero, tipo, valor in lancamentos:
+            conta = encontrar(numero)
+            aplicados.append((numero, tipo, valor, len(conta.historico.transacoes)))
+            conta.aplicar_lancamento(tipo, valor, data)
+        return aplicados
+
+    def executar(self) -> int:
+        """
+        Executa os blocos pendentes e retorna a quantidade de lançamentos aplicados
+        (incluindo os reaplicados do diário). Um job já concluído retorna 0.
+        """
+        concluidos, total = self._carregar_checkpoint()
+        if concluidos is None:
+            return 0
+        classe_executor = ThreadPoolExecutor if self._executor == 'thread' else ProcessPoolExecutor
+
+        with classe_executor(max_workers=self._workers) as executor:
+            futuros = [executor.submit(_calcular_bloco, self._regra, indice, bloco)
+                       for indice, bloco in self._blocos(concluidos)]
+            erro = None
+            for futuro in as_completed(futuros):
+                try:
+                    indice, lancamentos = futuro.result()
+                except Exception as falha:
+                    # Os blocos que terminaram bem ainda são aplicados e registrados antes de propagar o erro
+                    erro = erro or falha
+                    continue
+                aplicados = self._aplicar(lancamentos)
+                total += len(lancamentos)
+                self._registrar_bloco(indice, aplicados)
+        if erro is not None:
+            raise erro
+
+        self._concluir()
+        return total
@@ -0,0 +1,183 @@
+import bisect
+import datetime
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Set, Tuple
+
+# Projeções (read models) atualizadas incrementalmente a partir dos eventos
+# publicados em SistemaBancario.barramento. Uso:
+#
+#     saldos = ProjecaoSaldos()
+#     sistema.assinar_eventos(saldos.aplicar)
+#     saldos.contas_com_saldo_acima(1000.0)
+
+class Projecao(ABC):
+    @abstractmethod
+    def aplicar(self, evento):
+        pass
+
+    def inicializar(self, contas):
+        """Carrega o estado atual de contas já existentes (ex: após restaurar o sistema)."""
+        for conta in contas:
+            self.aplicar(conta.criar_evento('Abertura', 0.0))
+
+# Lista ordenada em blocos
+class _ListaOrdenada:
+    """
+    Lista ordenada dividida em blocos de até 2 * TAMANHO_BLOCO itens, com o
+    maior item de cada bloco guardado à parte. Inserir ou remover acha o bloco
+    por busca binária e só desloca os itens daquele bloco: O(log n + B), em vez
+    dos O(n) de uma única lista. Dividir um bloco cheio desloca a lista de
+    blocos (O(n / B)), o que acontece uma vez a cada B inserções.
+    """
+    TAMANHO_BLOCO = 1000
+
+    def __init__(self):
+        self._blocos: List[list] = []
+        self._maximos: list = []
+        self._tamanho = 0
+
+    def __len__(self) -> int:
+        return self._tamanho
+
+    def adicionar(self, item):
+        self._tamanho += 1
+        if not self._blocos:
+            self._blocos.append([item])
+            self._maximos.append(item)
+            return
+
+        indice = bisect.bisect_left(self._maximos, item)
+        if indice == len(self._blocos):
+            # Maior que tudo: entra no fim do último bloco
+            indice -= 1
+            self._blocos[indice].append(item)
+            self._maximos[indice] = item
+        else:
+            bisect.insort(self._blocos[indice], item)
+
+        bloco = self._blocos[indice]
+        if len(bloco) > 2 * self.TAMANHO_BLOCO:
+            metade = bloco[self.TAMANHO_BLOCO:]
+            del bloco[self.TAMANHO_BLOCO:]
+            self._blocos.insert(indice + 1, metade)
+            self._maximos[indice] = bloco[-1]
+            self._maximos.insert(indice + 1, metade[-1])
+
+    def remover(self, item):
+        indice = bisect.bisect_left(self._maximos, item)
+        bloco = self._blocos[indice]
+        posicao = bisect.bisect_left(bloco, item)
+        del bloco[posicao]
+        self._tamanho -= 1
+        if not bloco:
+            del self._blocos[indice]
+            del self._maximos[indice]
+        elif posicao == len(bloco):
+            self._maximos[indice] = bloco[-1]
+
+    def intervalo(self, inferior, superior=None) -> list:
+        """Itens entre `inferior` e `superior` (inclusive; sem `superior`, até o fim)."""
+        resultado = []
+        indice = bisect.bisect_left(self._maximos, inferior)
+        if indice == len(self._blocos):
+            return resultado
+        inicio = bisect.bisect_left(self._blocos[indice], inferior)
+        while indice < len(self._blocos):
+            bloco = self._blocos[indice]
+            if superior is not None and self._maximos[indice] > superior:
+                resultado.extend(bloco[inicio:bisect.bisect_right(bloco, superior)])
+                break
+            resultado.extend(bloco[inicio:])
+            inicio = 0
+            indice += 1
+        return resultado
+
+# Índice ordenado de saldos
+class ProjecaoSaldos(Projecao):
+    """
+    Mantém as contas ordenadas por saldo em uma _ListaOrdenada. Consultas por
+    faixa de saldo custam O(log n + k). Cada evento roda dentro do depósito ou
+    saque e custa uma remoção e uma inserção: O(log n + B), com B fixo (o
+    tamanho do bloco), e não cresce com o número de contas.
+    """
+    def __init__(self):
+        self._indice = _ListaOrdenada()
+        self._saldo_por_conta: Dict[int, float] = {}
+
+    def aplicar(self, evento):
+        saldo_anterior = self._saldo_por_conta.get(evento.numero_conta)
+        if saldo_anterior is not None:
+            if saldo_anterior == evento.saldo:
+                return
+            self._indice.remover((saldo_anterior, evento.numero_conta))
+
+        self._indice.adicionar((evento.saldo, evento.numero_conta))
+        self._saldo_por_conta[evento.numero_conta] = evento.saldo
+
+    def saldo(self, numero_conta: int) -> Optional[float]:
+        return self._saldo_por_conta.get(numero_conta)
+
+    def contas_com_saldo_entre(self, minimo: float, maximo: float) -> List[int]:
+        return [numero for _, numero in self._indice.intervalo((minimo, -1), (maximo, float('inf')))]
+
+    def contas_com_saldo_acima(self, valor: float) -> List[int]:
+        return [numero for _, numero in self._indice.intervalo((valor, float('inf')))]
+
+    def __len__(self) -> int:
+        return len(self._indice)
+
+# Contas que atingiram o limite de saques diários
+class ProjecaoLimiteDiario(Projecao):
+    def __init__(self):
+        self._dia: Optional[datetime.date] = None
+        self._no_limite: Set[int] = set()
+
+    def aplicar(self, evento):
+        dia = evento.data.date()
+        if dia != self._dia:
+            # Virada do dia: os contadores de saque das contas são zerados
+            self._dia = dia
+            self._no_limite = set()
+
+        if evento.limite_saques and evento.saques_hoje >= evento.limite_saques:
+            self._no_limite.add(evento.numero_conta)
+        else:
+            self._no_limite.discard(evento.numero_conta)
+
+    def contas_no_limite(self, hoje: Optional[datetime.date] = None) -> Set[int]:
+        hoje = hoje or datetime.date.today()
+        if hoje != self._dia:
+            return set()
+        return set(self._no_limite)
+
+# Totais por cliente
+class TotaisCliente:
+    def __init__(self):
+        self.saldo = 0.0
+        self.total_depositos = 0.0
+        self.total_saques = 0.0
+        self.quantidade_transacoes = 0
+
+class ProjecaoTotaisCliente(Projecao):
+    def __init__(self):
+        self._totais: Dict[str, TotaisCliente] = {}
+        self._saldo_por_conta: Dict[int, float] = {}
+
+    def aplicar(self, evento):
+        totais = self._totais.get(evento.cpf)
+        if totais is None:
+            totais = self._totais[evento.cpf] = TotaisCliente()
+
+        saldo_anterior = self._saldo_por_conta.get(evento.numero_conta, 0.0)
+        totais.saldo += evento.saldo - saldo_anterior
+        self._saldo_por_conta[evento.numero_conta] = evento.saldo
+
+        if evento.tipo == 'Deposito':
+            totais.total_depositos += evento.valor
+            totais.quantidade_transacoes += 1
+        elif evento.tipo == 'Saque':
+            totais.total_saques += evento.valor
+            totais.quantidade_transacoes += 1
+
+    def totais(self, cpf: str) -> Optional[TotaisCliente]:
+        return self._totais.get(cpf)
@@ -0,0 +1,61 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from SistemaBancarioFinal import EstadoConta, EventoTransacao
+
+# Réplica de leitura
+#
+# Mantém uma cópia própria dos saldos e históricos, alimentada apenas pelo
+# fluxo de eventos do sistema principal. Pode ficar no mesmo processo
+# (sistema.assinar_eventos(replica.aplicar)) ou em outro, recebendo os
+# eventos por fila, socket, arquivo, etc (replica.alimentar(eventos)).
+# Os relatórios pesados rodam na réplica, longe das contas usadas pelos
+# depósitos e saques.
+
+class VisaoReplica:
+    def __init__(self, versao: int, estados: Dict[int, EstadoConta],
+                 historicos: Dict[int, List[Tuple[str, float, object]]]):
+        self._versao = versao
+        self._estados = estados
+        self._historicos = historicos
+
+    @property
+    def versao(self) -> int:
+        return self._versao
+
+    def numeros_contas(self) -> List[int]:
+        return sorted(self._estados)
+
+    def saldo(self, numero_conta: int) -> Optional[float]:
+        estado = self._estados.get(numero_conta)
+        return estado.saldo if estado else None
+
+    def transacoes(self, numero_conta: int) -> List[Tuple[str, float, object]]:
+        estado = self._estados.get(numero_conta)
+        if estado is None:
+            return []
+        return self._historicos[numero_conta][:estado.transacoes]
+
+class ReplicaLeitura:
+    def __init__(self):
+        self._estados: Dict[int, EstadoConta] = {}
+        self._historicos: Dict[int, List[Tuple[str, float, object]]] = {}
+        self._versao = 0
+
+    @property
+    def versao(self) -> int:
+        return self._versao
+
+    def aplicar(self, evento: EventoTransacao):
+        historico = self._historicos.setdefault(evento.numero_conta, [])
+        if evento.tipo != 'Abertura':
+            historico.append((evento.tipo, evento.valor, evento.data))
+        self._estados[evento.numero_conta] = EstadoConta(evento.saldo, len(historico), evento.saques_hoje)
+        self._versao += 1
+
+    def alimentar(self, eventos: Iterable[EventoTransacao]):
+        for evento in eventos:
+            self.aplicar(evento)
+
+    def capturar_visao(self) -> VisaoReplica:
+        # Mesma ideia do SistemaBancario: estados imutáveis + históricos que só crescem
+        return VisaoReplica(self._versao, self._estados.copy(), self._historicos)
@@ -0,0 +1,304 @@
+import datetime
+import gc
+import pickle
+import struct
+import threading
+from array import array
+from typing import Optional
+
+from SistemaBancarioFinal import (
+    CacheIdempotencia, Conta, ContaCorrente, EstadoConta, Historico, PessoaFisica, SistemaBancario
+)
+from limites import MotorLimites
+
+# Formato do snapshot:
+#   cabeçalho  -> MAGICO (6 bytes) + versão (uint16, little-endian)
+#   conteúdo   -> pickle de um dicionário de colunas (listas e arrays)
+#
+# Os dados ficam em colunas (um array por campo) em vez de um pickle dos
+# objetos. A restauração só carrega as colunas e monta os índices de busca;
+# cada cliente (com suas contas) vira objeto na primeira vez em que é usado,
+# sem chamar os construtores nem refazer validações (strptime, CPF duplicado).
+MAGICO = b"SBSNAP"
+VERSAO = 2
+CABECALHO = struct.Struct("<6sH")
+
+# Compartilhado por todos os históricos restaurados: a materialização acontece
+# uma vez por conta, não vale um lock por histórico
+_LOCK_HISTORICOS = threading.Lock()
+
+class HistoricoRestaurado(Historico):
+    """
+    Histórico carregado de um snapshot. As transações só são convertidas de
+    volta para dicionários no primeiro acesso, o que evita criar milhões de
+    objetos `datetime` durante a inicialização.
+    """
+    def __init__(self, nomes: list, tipos: array, valores: array, datas: array):
+        self._transacoes = None
+        self._colunas = (nomes, tipos, valores, datas)
+
+    @property
+    def transacoes(self):
+        if self._transacoes is None:
+            self._materializar()
+        return self._transacoes
+
+    def adicionar_lancamento(self, tipo, valor, data):
+        if self._transacoes is None:
+            self._materializar()
+        super().adicionar_lancamento(tipo, valor, data)
+
+    def _materializar(self):
+        # Um leitor (extrato, visão) e um escritor podem chegar aqui juntos: sem
+        # o lock, a lista montada por um poderia substituir a que já recebeu um
+        # lançamento do outro
+        with _LOCK_HISTORICOS:
+            if self._transacoes is not None:
+                return
+            nomes, tipos, valores, datas = self._colunas
+            data_de_timestamp = datetime.datetime.fromtimestamp
+            self._transacoes = [
+                {'tipo': nomes[tipo], 'valor': valor, 'data': data_de_timestamp(data)}
+                for tipo, valor, data in zip(tipos, valores, datas)
+            ]
+            self._colunas = None
+
+class SistemaBancarioRestaurado(SistemaBancario):
+    """
+    SistemaBancario restaurado de um snapshot. Clientes e contas continuam nas
+    colunas do snapshot até serem usados: a busca por número da conta ou por
+    CPF monta só o cliente envolvido e as contas dele. Percorrer `contas` ou
+    `clientes` (listagens, relatórios, jobs em lote) monta todos de uma vez e
+    libera as colunas.
+    """
+    def __init__(self, dados: dict, cache_idempotencia: Optional[CacheIdempotencia] = None,
+                 motor_limites: Optional[MotorLimites] = None):
+        super().__init__(cache_idempotencia, motor_limites)
+        self._dados = dados
+        self._numero_conta_sequencial = dados['numero_conta_sequencial']
+        self._linha_conta = dict(zip(dados['contas_numero'], range(len(dados['contas_numero']))))
+        self._linha_cliente = dict(zip(dados['clientes_cpf'], range(len(dados['clientes_cpf']))))
+        self._lock_materializacao = threading.RLock()
+        # Até tudo ser montado, _clientes e _contas guardam só os cadastrados após a restauração
+
+    @property
+    def contas(self):
+        self._materializar_tudo()
+        return self._contas
+
+    @property
+    def clientes(self):
+        self._materializar_tudo()
+        return self._clientes
+
+    def tem_clientes(self) -> bool:
+        # Não monta nada: basta olhar as colunas ainda não materializadas
+        dados = self._dados
+        return bool(self._clientes) or (dados is not None and len(dados['clientes_cpf']) > 0)
+
+    def encontrar_conta_por_numero(self, numero: int) -> Optional[Conta]:
+        conta = self._contas_por_numero.get(numero)
+        if conta is None and self._dados is not None:
+            with self._lock_materializacao:
+                if self._dados is not None:
+                    linha = self._linha_conta.get(numero)
+                    if linha is not None:
+                        self._materializar_cliente(self._dados['contas_cliente'][linha])
+                conta = self._contas_por_numero.get(numero)
+        return conta
+
+    def encontrar_cliente_por_cpf(self, cpf: str) -> Optional[PessoaFisica]:
+        cpf_limpo = ''.join(filter(str.isdigit, cpf))
+        cliente = self._clientes_por_cpf.get(cpf_limpo)
+        if cliente is None and self._dados is not None:
+            with self._lock_materializacao:
+                if self._dados is not None:
+                    linha = self._linha_cliente.get(cpf_limpo)
+                    if linha is not None:
+                        self._materializar_cliente(linha)
+                cliente = self._clientes_por_cpf.get(cpf_limpo)
+        return cliente
+
+    def _nova_conta(self, cliente: PessoaFisica, numero: int, agencia: str, saldo: float, corrente: int,
+                    limite: float, limite_saques: int, saques_hoje: int, ultima_data: int,
+                    inicio: int, fim: int) -> Conta:
+        dados = self._dados
+        novo = object.__new__
+        if fim > inicio:
+            historico = HistoricoRestaurado(dados['hist_tipos_nomes'], dados['hist_tipos'][inicio:fim],
+                                            dados['hist_valores'][inicio:fim], dados['hist_datas'][inicio:fim])
+        else:
+            historico = novo(Historico)
+            historico._transacoes = []
+
+        conta = novo(ContaCorrente if corrente else Conta)
+        conta.__dict__.update(_saldo=saldo, _numero=numero, _agencia=agencia, _cliente=cliente,
+                              _historico=historico, _barramento=self._barramento)
+        if corrente:
+            conta.__dict__.update(_limite=limite, _limite_saques=limite_saques, _saques_hoje=saques_hoje,
+                                  _ultima_data=datetime.date.fromordinal(ultima_data))
+            saques_hoje = conta.saques_hoje
+        cliente._contas.append(conta)
+        self._contas_por_numero[numero] = conta
+        self._estados[numero] = EstadoConta(saldo, fim - inicio, saques_hoje if corrente else 0)
+        return conta
+
+    @staticmethod
+    def _novo_cliente(cpf: str, nome: str, nascimento: int, endereco: str) -> PessoaFisica:
+        cliente = object.__new__(PessoaFisica)
+        cliente.__dict__.update(_endereco=endereco, _contas=[], _cpf=cpf, _nome=nome,
+                                _data_nascimento=datetime.date.fromordinal(nascimento))
+        return cliente
+
+    def _materializar_cliente(self, linha: int):
+        # Chamado sempre com _lock_materializacao adquirido
+        dados = self._dados
+        cpf = dados['clientes_cpf'][linha]
+        if cpf in self._clientes_por_cpf:
+            return
+
+        cliente = self._novo_cliente(cpf, dados['clientes_nome'][linha], dados['clientes_nascimento'][linha],
+                                     dados['clientes_endereco'][linha])
+        inicio_contas = dados['clientes_contas_inicio']
+        hist_inicio = dados['hist_inicio']
+        for i in dados['clientes_contas'][inicio_contas[linha]:inicio_contas[linha + 1]]:
+            self._nova_conta(cliente, dados['contas_numero'][i], dados['contas_agencia'][i],
+                             dados['contas_saldo'][i], dados['contas_corrente'][i], dados['contas_limite'][i],
+                             dados['contas_limite_saques'][i], dados['contas_saques_hoje'][i],
+                             dados['contas_ultima_data'][i], hist_inicio[i], hist_inicio[i + 1])
+        self._clientes_por_cpf[cpf] = cliente
+
+    def _materializar_tudo(self):
+        if self._dados is None:
+            return
+        with self._lock_materializacao:
+            dados = self._dados
+            if dados is None:
+                return
+            coletor_ativo = gc.isenabled()
+            gc.disable()
+            try:
+                self._montar_restantes(dados)
+            finally:
+                if coletor_ativo:
+                    gc.enable()
+            self._dados = None
+            self._linha_conta = None
+            self._linha_cliente = None
+
+    def _montar_restantes(self, dados: dict):
+        # Percorre as colunas em sequência (bem mais rápido que montar cliente a cliente),
+        # pulando os clientes que já foram montados por alguma busca
+        ja_montados = set(self._clientes_por_cpf)
+        clientes = []
+        for cpf, nome, nascimento, endereco in zip(dados['clientes_cpf'], dados['clientes_nome'],
+                                                   dados['clientes_nascimento'], dados['clientes_endereco']):
+            cliente = self._clientes_por_cpf.get(cpf)
+            if cliente is None:
+                cliente = self._clientes_por_cpf[cpf] = self._novo_cliente(cpf, nome, nascimento, endereco)
+            clientes.append(cliente)
+
+        contas = []
+        hist_inicio = dados['hist_inicio']
+        colunas_contas = zip(dados['contas_numero'], dados['contas_agencia'], dados['contas_cliente'],
+                             dados['contas_saldo'], dados['contas_corrente'], dados['contas_limite'],
+                             dados['contas_limite_saques'], dados['contas_saques_hoje'],
+                             dados['contas_ultima_data'], hist_inicio, hist_inicio[1:])
+        for (numero, agencia, indice_cliente, saldo, corrente, limite,
+             limite_saques, saques_hoje, ultima_data, inicio, fim) in colunas_contas:
+            cliente = clientes[indice_cliente]
+            if cliente.cpf in ja_montados:
+                contas.append(self._contas_por_numero[numero])
+            else:
+                contas.append(self._nova_conta(cliente, numero, agencia, saldo, corrente, limite,
+                                               limite_saques, saques_hoje, ultima_data, inicio, fim))
+
+        # Restaurados primeiro, na ordem original; depois os cadastrados após a restauração
+        self._clientes = clientes + self._clientes
+        self._contas = contas + self._contas
+
+def _colunas(sistema: SistemaBancario) -> dict:
+    clientes = sistema.clientes
+    indice_cliente = {cliente.cpf: i for i, cliente in enumerate(clientes)}
+
+    contas = sistema.contas
+    eh_corrente = [isinstance(conta, ContaCorrente) for conta in contas]
+
+    # Contas agrupadas por cliente (cada cliente aponta para um trecho de clientes_contas)
+    linha_conta = {conta.numero: i for i, conta in enumerate(contas)}
+    clientes_contas_inicio = array('q', [0])
+    clientes_contas = array('q')
+    for cliente in clientes:
+        clientes_contas.extend(linha_conta[conta.numero] for conta in cliente.contas)
+        clientes_contas_inicio.append(len(clientes_contas))
+
+    tipos_transacao = []
+    codigo_tipo = {}
+    hist_inicio = array('q', [0])
+    hist_tipos = array('b')
+    hist_valores = array('d')
+    hist_datas = array('d')
+    for conta in contas:
+        for transacao in conta.historico.transacoes:
+            codigo = codigo_tipo.get(transacao['tipo'])
+            if codigo is None:
+                codigo = codigo_tipo[transacao['tipo']] = len(tipos_transacao)
+                tipos_transacao.append(transacao['tipo'])
+            hist_tipos.append(codigo)
+            hist_valores.append(transacao['valor'])
+            hist_datas.append(transacao['data'].timestamp())
+        hist_inicio.append(len(hist_tipos))
+
+    return {
+        'numero_conta_sequencial': sistema._numero_conta_sequencial,
+        'clientes_cpf': [cliente.cpf for cliente in clientes],
+        'clientes_nome': [cliente.nome for cliente in clientes],
+        'clientes_nascimento': array('i', (cliente.data_nascimento.toordinal() for cliente in clientes)),
+        'clientes_endereco': [cliente.endereco for cliente in clientes],
+        'clientes_contas_inicio': clientes_contas_inicio,
+        'clientes_contas': clientes_contas,
+        'contas_numero': array('q', (conta.numero for conta in contas)),
+        'contas_agencia': [conta.agencia for conta in contas],
+        'contas_cliente': array('q', (indice_cliente[conta.cliente.cpf] for conta in contas)),
+        'contas_saldo': array('d', (conta.saldo for conta in contas)),
+        'contas_corrente': array('b', eh_corrente),
+        'contas_limite': array('d', (conta.limite if cc else 0.0 for conta, cc in zip(contas, eh_corrente))),
+        'contas_limite_saques': array('q', (conta.limite_saques if cc else 0 for conta, cc in zip(contas, eh_corrente))),
+        'contas_saques_hoje': array('q', (conta.saques_hoje if cc else 0 for conta, cc in zip(contas, eh_corrente))),
+        'contas_ultima_data': array('i', (conta._ultima_data.toordinal() if cc else 0
+                                          for conta, cc in zip(contas, eh_corrente))),
+        'hist_tipos_nomes': tipos_transacao,
+        'hist_inicio': hist_inicio,
+        'hist_tipos': hist_tipos,
+        'hist_valores': hist_valores,
+        'hist_datas': hist_datas,
+    }
+
+def salvar_snapshot(sistema: SistemaBancario, caminho: str):
+    """Grava o estado completo do sistema (clientes, contas, históricos, índices e contadores)."""
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(CABECALHO.pack(MAGICO, VERSAO))
+        pickle.dump(_colunas(sistema), arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+
+def restaurar_snapshot(caminho: str, cache_idempotencia: CacheIdempotencia = None,
+                       motor_limites: MotorLimites = None) -> SistemaBancario:
+    """Reconstrói um SistemaBancario a partir de um arquivo gerado por `salvar_snapshot`."""
+    with open(caminho, 'rb') as arquivo:
+        cabecalho = arquivo.read(CABECALHO.size)
+        if len(cabecalho) != CABECALHO.size:
+            raise ValueError("Arquivo de snapshot inválido.")
+        magico, versao = CABECALHO.unpack(cabecalho)
+        if magico != MAGICO:
+            raise ValueError("Arquivo de snapshot inválido.")
+        if versao != VERSAO:
+            raise ValueError(f"Versão de snapshot não suportada: {versao}.")
+
+        # O coletor de lixo fica desligado durante a carga: ele seria disparado
+        # várias vezes sem nada para coletar, só pela quantidade de objetos
+        coletor_ativo = gc.isenabled()
+        gc.disable()
+        try:
+            return SistemaBancarioRestaurado(pickle.load(arquivo), cache_idempotencia, motor_limites)
+        finally:
+            if coletor_ativo:
+                gc.enable()
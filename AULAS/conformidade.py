@@ -0,0 +1,269 @@
+import argparse
+import contextlib
+import datetime
+import importlib
+import importlib.util
+import io
+import math
+import os
+import random
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "SistemaBancario"))
+
+import Projeto_Bancario
+import Projeto_bancario2
+import SistemaBancarioFinal
+
+# Harness de conformidade entre as implementações das regras bancárias
+#
+# Executa os mesmos fluxos aleatórios de operações (depósito, saque, virada
+# de dia) em todas as implementações registradas, compara saldo, operações
+# aceitas/recusadas e histórico, e mede a vazão relativa de cada uma.
+# Novas implementações (ex: um motor otimizado) entram com
+# registrar_implementacao(nome, classe), chamado por um módulo carregado
+# com --modulo (nome importável ou caminho de um arquivo .py).
+#
+#   python conformidade.py --fluxos 200 --operacoes 100
+#   python conformidade.py --modulo motor_otimizado.py --referencia otimizado
+
+Operacao = Tuple[str, float]
+
+class Implementacao(ABC):
+    """Adaptador de uma implementação para uma única conta."""
+    @abstractmethod
+    def depositar(self, valor: float) -> bool:
+        pass
+
+    @abstractmethod
+    def sacar(self, valor: float) -> bool:
+        pass
+
+    @abstractmethod
+    def virar_dia(self):
+        """Simula a passagem para o dia seguinte."""
+
+    @abstractmethod
+    def saldo(self) -> float:
+        pass
+
+    @abstractmethod
+    def historico(self) -> Tuple[tuple, tuple]:
+        """Retorna (depósitos, saques) na ordem em que foram efetivados."""
+
+class ImplementacaoBasica(Implementacao):
+    """ContaBancaria (Projeto_Bancario.py)."""
+    def __init__(self):
+        self._conta = Projeto_Bancario.ContaBancaria()
+
+    def depositar(self, valor: float) -> bool:
+        return self._conta.depositar(valor)
+
+    def sacar(self, valor: float) -> bool:
+        return self._conta.sacar(valor)
+
+    def virar_dia(self):
+        # Esta versão não tem reinício diário do contador de saques
+        pass
+
+    def saldo(self) -> float:
+        return self._conta.saldo
+
+    def historico(self) -> Tuple[tuple, tuple]:
+        return tuple(self._conta.depositos), tuple(self._conta.saques)
+
+class ImplementacaoModular(Implementacao):
+    """API de dicionários e funções (Projeto_bancario2.py). Usa o estado global do módulo."""
+    def __init__(self):
+        Projeto_bancario2.usuarios.clear()
+        Projeto_bancario2.contas.clear()
+        Projeto_bancario2.numero_conta_sequencial = 1
+        Projeto_bancario2.cadastrar_usuario("Cliente", "01/01/1990", "00000000000", "Rua A, 1 - Centro - Suzano/SP")
+        Projeto_bancario2.cadastrar_conta_bancaria("00000000000")
+        self._conta = Projeto_bancario2.contas[0]
+
+    def depositar(self, valor: float) -> bool:
+        return Projeto_bancario2.depositar(valor)
+
+    def sacar(self, valor: float) -> bool:
+        return Projeto_bancario2.sacar(valor=valor)
+
+    def virar_dia(self):
+        self._conta['ultima_data'] -= datetime.timedelta(days=1)
+
+    def saldo(self) -> float:
+        return self._conta['saldo']
+
+    def historico(self) -> Tuple[tuple, tuple]:
+        return (tuple(valor for valor, _ in self._conta['depositos']),
+                tuple(valor for valor, _ in self._conta['saques']))
+
+class ImplementacaoPOO(Implementacao):
+    """SistemaBancario (SistemaBancario/SistemaBancarioFinal.py)."""
+    def __init__(self):
+        self._sistema = SistemaBancarioFinal.SistemaBancario()
+        self._sistema.cadastrar_cliente("00000000000", "Cliente", "01/01/1990", "Rua A, 1 - Centro - Suzano/SP")
+        self._sistema.cadastrar_conta_corrente("00000000000")
+        self._conta = self._sistema.encontrar_conta_por_numero(1)
+
+    def depositar(self, valor: float) -> bool:
+        return self._sistema.depositar(1, valor)
+
+    def sacar(self, valor: float) -> bool:
+        return self._sistema.sacar(1, valor)
+
+    def virar_dia(self):
+        self._conta._ultima_data -= datetime.timedelta(days=1)
+
+    def saldo(self) -> float:
+        return self._conta.saldo
+
+    def historico(self) -> Tuple[tuple, tuple]:
+        transacoes = self._conta.historico.transacoes
+        return (tuple(t['valor'] for t in transacoes if t['tipo'] == 'Deposito'),
+                tuple(t['valor'] for t in transacoes if t['tipo'] == 'Saque'))
+
+IMPLEMENTACOES: Dict[str, type] = {
+    'poo': ImplementacaoPOO,
+    'modular': ImplementacaoModular,
+    'basico': ImplementacaoBasica,
+}
+
+def registrar_implementacao(nome: str, classe: type):
+    IMPLEMENTACOES[nome] = classe
+
+# Geração dos fluxos
+def gerar_fluxo(operacoes: int, semente: int) -> List[Operacao]:
+    """Mistura valores comuns com casos de borda: zero, negativos e acima do limite por saque."""
+    rng = random.Random(semente)
+    fluxo = []
+    for _ in range(operacoes):
+        sorteio = rng.random()
+        if sorteio < 0.05:
+            fluxo.append(('virar_dia', 0.0))
+            continue
+        operacao = 'depositar' if sorteio < 0.5 else 'sacar'
+        valor = rng.choice([
+            round(rng.uniform(0.01, 500), 2),
+            round(rng.uniform(0.01, 500), 2),
+            round(rng.uniform(500.01, 2000), 2),
+            500.0,
+            0.0,
+            -round(rng.uniform(0.01, 100), 2),
+        ])
+        fluxo.append((operacao, valor))
+    return fluxo
+
+def executar_fluxo(classe: type, fluxo: List[Operacao]) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        implementacao = classe()
+        resultados = []
+        inicio = time.perf_counter()
+        for operacao, valor in fluxo:
+            if operacao == 'virar_dia':
+                implementacao.virar_dia()
+                resultados.append(None)
+            else:
+                resultados.append(bool(getattr(implementacao, operacao)(valor)))
+        duracao = time.perf_counter() - inicio
+    return {
+        'resultados': resultados,
+        'saldo': implementacao.saldo(),
+        'historico': implementacao.historico(),
+        'duracao': duracao,
+    }
+
+def comparar(fluxo: List[Operacao], referencia: dict, outro: dict) -> List[str]:
+    diferencas = []
+    for indice, (esperado, obtido) in enumerate(zip(referencia['resultados'], outro['resultados'])):
+        if esperado != obtido:
+            operacao, valor = fluxo[indice]
+            diferencas.append(f"operação {indice} ({operacao} {valor:.2f}): "
+                              f"{'aceita' if esperado else 'recusada'} na referência, "
+                              f"{'aceita' if obtido else 'recusada'} aqui")
+            break
+    if not math.isclose(referencia['saldo'], outro['saldo'], abs_tol=1e-9):
+        diferencas.append(f"saldo final {outro['saldo']:.2f} (referência {referencia['saldo']:.2f})")
+    if referencia['historico'] != outro['historico']:
+        diferencas.append("histórico diferente")
+    return diferencas
+
+def carregar_modulo(modulo: str):
+    """Importa um módulo (pelo nome ou pelo caminho do arquivo) que registra implementações."""
+    if modulo.endswith(".py"):
+        nome = os.path.splitext(os.path.basename(modulo))[0]
+        especificacao = importlib.util.spec_from_file_location(nome, modulo)
+        if especificacao is None:
+            raise ImportError(f"Não foi possível carregar {modulo}.")
+        carregado = importlib.util.module_from_spec(especificacao)
+        sys.modules[nome] = carregado
+        especificacao.loader.exec_module(carregado)
+    else:
+        # Como em `python -m`, módulos do diretório atual também podem ser importados pelo nome
+        if os.getcwd() not in sys.path:
+            sys.path.append(os.getcwd())
+        importlib.import_module(modulo)
+
+def main() -> int:
+    # Os módulos extras são carregados antes de montar as opções de --referencia
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument('--modulo', action='append', default=[],
+                            help="módulo que chama registrar_implementacao (pode repetir)")
+    for modulo in pre_parser.parse_known_args()[0].modulo:
+        carregar_modulo(modulo)
+
+    parser = argparse.ArgumentParser(description="Conformidade e desempenho entre as implementações.",
+                                     parents=[pre_parser])
+    parser.add_argument('--fluxos', type=int, default=200)
+    parser.add_argument('--operacoes', type=int, default=100)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--referencia', default='poo', choices=sorted(IMPLEMENTACOES))
+    parser.add_argument('--detalhes', type=int, default=3, help="divergências exibidas por implementação")
+    args = parser.parse_args()
+
+    nomes = [args.referencia] + [nome for nome in IMPLEMENTACOES if nome != args.referencia]
+    tempos = {nome: 0.0 for nome in nomes}
+    divergencias: Dict[str, List[str]] = {nome: [] for nome in nomes}
+
+    for i in range(args.fluxos):
+        fluxo = gerar_fluxo(args.operacoes, args.semente + i)
+        execucoes = {nome: executar_fluxo(IMPLEMENTACOES[nome], fluxo) for nome in nomes}
+        for nome in nomes:
+            tempos[nome] += execucoes[nome]['duracao']
+        for nome in nomes[1:]:
+            diferencas = comparar(fluxo, execucoes[args.referencia], execucoes[nome])
+            if diferencas:
+                divergencias[nome].append(f"fluxo {args.semente + i}: " + "; ".join(diferencas))
+
+    total_operacoes = args.fluxos * args.operacoes
+    print("\n" + "="*50)
+    print("🔬 CONFORMIDADE ENTRE IMPLEMENTAÇÕES")
+    print("="*50)
+    print(f"Fluxos: {args.fluxos} x {args.operacoes} operações | Referência: {args.referencia}")
+    for nome in nomes:
+        if total_operacoes and tempos[nome] > 0 and tempos[args.referencia] > 0:
+            vazao = total_operacoes / tempos[nome]
+            relativa = tempos[args.referencia] / tempos[nome]
+            print(f"\n{nome}: {vazao:,.0f} operações/s ({relativa:.2f}x da referência)")
+        else:
+            print(f"\n{nome}: sem operações medidas")
+        if nome == args.referencia:
+            continue
+        if divergencias[nome]:
+            print(f"   ❌ {len(divergencias[nome])}/{args.fluxos} fluxos divergentes")
+            for detalhe in divergencias[nome][:args.detalhes]:
+                print(f"      - {detalhe}")
+        else:
+            print("   ✅ Comportamento idêntico à referência")
+    print("="*50 + "\n")
+
+    return 1 if any(divergencias.values()) else 0
+
+if __name__ == "__main__":
+    # Os módulos de --modulo fazem `import conformidade`: precisam receber este
+    # módulo (e o mesmo IMPLEMENTACOES), não uma segunda cópia
+    sys.modules.setdefault('conformidade', sys.modules[__name__])
+    sys.exit(main())
@@ -0,0 +1,233 @@
+import argparse
+import contextlib
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "SistemaBancario"))
+
+import Projeto_Bancario
+import Projeto_bancario2
+import SistemaBancarioFinal
+
+# Driver de replay/carga para os menus interativos
+#
+# Os menus leem cada resposta através do parâmetro `entrada` (padrão: input).
+# Este módulo passa no lugar uma função que devolve as linhas de um roteiro,
+# exercitando exatamente o mesmo fluxo de comandos usado pelo usuário.
+#
+# Exemplos:
+#   python replay.py final --gerar 10000 --threads 4
+#   python replay.py modular --roteiro incidente.txt
+#   python replay.py final --gravar sessao.txt      (sessão interativa gravada)
+#
+# Formato do roteiro: uma resposta por linha. Linhas começando com '#' são
+# comentários; uma resposta que comece com '#' ou '\' é escrita com uma
+# '\' na frente (ex: '\#123' é a resposta '#123').
+
+COMENTARIO = "#"
+ESCAPE = "\\"
+
+PROMPT_MENU = "Escolha uma opção"
+
+class FimDoRoteiro(Exception):
+    """Lançada quando o menu pede uma resposta e o roteiro já terminou."""
+
+class EntradaRoteiro:
+    """
+    Substitui o input() dos menus, devolvendo as respostas do roteiro.
+    Mede a latência de cada comando como o tempo entre dois pedidos
+    consecutivos do menu principal.
+    """
+    def __init__(self, respostas: List[str]):
+        self._respostas = iter(respostas)
+        self._inicio_comando: Optional[float] = None
+        self.latencias: List[float] = []
+
+    def __call__(self, prompt: str = "") -> str:
+        if PROMPT_MENU in prompt:
+            agora = time.perf_counter()
+            if self._inicio_comando is not None:
+                self.latencias.append(agora - self._inicio_comando)
+            self._inicio_comando = agora
+        try:
+            return next(self._respostas)
+        except StopIteration:
+            raise FimDoRoteiro() from None
+
+class EntradaGravada:
+    """Repassa o input() do usuário e grava cada resposta em um arquivo de roteiro."""
+    def __init__(self, arquivo):
+        self._arquivo = arquivo
+
+    def __call__(self, prompt: str = "") -> str:
+        resposta = input(prompt)
+        self._arquivo.write(escapar_resposta(resposta) + "\n")
+        self._arquivo.flush()
+        return resposta
+
+# Alvos: cada um devolve o menu a ser executado (compartilhando o estado entre threads)
+def _alvo_final() -> Callable:
+    return SistemaBancarioFinal.SistemaBancario().menu_principal
+
+def _alvo_modular() -> Callable:
+    Projeto_bancario2.usuarios.clear()
+    Projeto_bancario2.contas.clear()
+    Projeto_bancario2.numero_conta_sequencial = 1
+    return Projeto_bancario2.menu_principal
+
+def _alvo_basico() -> Callable:
+    return Projeto_Bancario.ContaBancaria().menu
+
+ALVOS = {
+    'final': _alvo_final,
+    'modular': _alvo_modular,
+    'basico': _alvo_basico,
+}
+
+# Geração de roteiros
+def gerar_preparacao(alvo: str, qtd_contas: int) -> List[str]:
+    """Cadastra clientes e contas antes da carga (não se aplica ao alvo 'basico')."""
+    if alvo == 'basico':
+        return []
+
+    respostas = []
+    for i in range(qtd_contas):
+        cpf = f"{i:011d}"
+        if alvo == 'final':
+            respostas += ["1", f"Cliente {i}", cpf, "01/01/1990", "Rua A, 1 - Centro - Suzano/SP", "2", cpf]
+        else:
+            respostas += ["1", f"Cliente {i}", "01/01/1990", cpf, "Rua A, 1 - Centro - Suzano/SP", "2", cpf]
+    return respostas
+
+def gerar_roteiro(alvo: str, operacoes: int, qtd_contas: int = 1, semente: int = 0) -> List[str]:
+    """Gera depósitos, saques e extratos aleatórios (saques e extratos com menos frequência)."""
+    rng = random.Random(semente)
+    opcoes = {
+        'final': ("5", "6", "7"),
+        'modular': ("5", "6", "7"),
+        'basico': ("1", "2", "3"),
+    }[alvo]
+
+    respostas = []
+    for _ in range(operacoes):
+        opcao = rng.choices(opcoes, weights=(6, 3, 1))[0]
+        respostas.append(opcao)
+        if alvo == 'final':
+            respostas.append(str(rng.randint(1, qtd_contas)))
+        if opcao != opcoes[2]:
+            respostas.append(f"{rng.uniform(1, 600):.2f}")
+    return respostas
+
+def escapar_resposta(resposta: str) -> str:
+    if resposta.startswith((COMENTARIO, ESCAPE)):
+        return ESCAPE + resposta
+    return resposta
+
+def ler_roteiro(caminho: str) -> List[str]:
+    respostas = []
+    with open(caminho, encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            linha = linha.rstrip("\n")
+            if linha.startswith(COMENTARIO):
+                continue
+            respostas.append(linha[1:] if linha.startswith(ESCAPE) else linha)
+    return respostas
+
+# Execução
+def executar(menu: Callable, roteiros: List[List[str]], mostrar_saida: bool = False) -> dict:
+    """Executa um roteiro por thread sobre o mesmo menu e retorna as estatísticas."""
+    entradas = [EntradaRoteiro(roteiro) for roteiro in roteiros]
+    erros = []
+
+    def rodar(entrada: EntradaRoteiro):
+        try:
+            menu(entrada)
+        except FimDoRoteiro:
+            pass
+        except Exception as erro:
+            erros.append(erro)
+
+    threads = [threading.Thread(target=rodar, args=(entrada,)) for entrada in entradas]
+    with contextlib.ExitStack() as pilha:
+        if not mostrar_saida:
+            pilha.enter_context(contextlib.redirect_stdout(pilha.enter_context(open(os.devnull, 'w'))))
+        inicio = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duracao = time.perf_counter() - inicio
+
+    latencias = sorted(latencia for entrada in entradas for latencia in entrada.latencias)
+    return {
+        'comandos': len(latencias),
+        'duracao': duracao,
+        'latencias': latencias,
+        'erros': erros,
+    }
+
+def _percentil(valores: List[float], p: float) -> float:
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+def imprimir_estatisticas(resultado: dict, threads: int):
+    latencias = resultado['latencias']
+    print("\n" + "="*50)
+    print("📈 RESULTADO DO REPLAY")
+    print("="*50)
+    print(f"Threads: {threads}")
+    print(f"Comandos executados: {resultado['comandos']}")
+    print(f"Duração: {resultado['duracao']:.3f}s")
+    if latencias:
+        print(f"Vazão: {resultado['comandos'] / resultado['duracao']:,.0f} comandos/s")
+        print(f"Latência média: {statistics.mean(latencias) * 1e6:.1f} µs")
+        print(f"Latência p50: {_percentil(latencias, 0.50) * 1e6:.1f} µs | "
+              f"p95: {_percentil(latencias, 0.95) * 1e6:.1f} µs | "
+              f"p99: {_percentil(latencias, 0.99) * 1e6:.1f} µs | "
+              f"máx: {latencias[-1] * 1e6:.1f} µs")
+    if resultado['erros']:
+        print(f"❌ Erros: {len(resultado['erros'])} (primeiro: {resultado['erros'][0]!r})")
+    print("="*50 + "\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay/carga dos menus do sistema bancário.")
+    parser.add_argument('alvo', choices=sorted(ALVOS))
+    parser.add_argument('--roteiro', help="arquivo com uma resposta por linha")
+    parser.add_argument('--gerar', type=int, default=0, help="quantidade de operações aleatórias por thread")
+    parser.add_argument('--contas', type=int, default=10, help="contas cadastradas antes da carga gerada (só com --gerar)")
+    parser.add_argument('--threads', type=int, default=1)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--gravar', help="grava uma sessão interativa neste arquivo")
+    parser.add_argument('--mostrar-saida', action='store_true')
+    args = parser.parse_args()
+
+    menu = ALVOS[args.alvo]()
+
+    if args.gravar:
+        with open(args.gravar, 'w', encoding='utf-8') as arquivo:
+            menu(EntradaGravada(arquivo))
+        return
+
+    if not args.roteiro and not args.gerar:
+        parser.error("informe --roteiro ou --gerar")
+
+    if args.roteiro:
+        # Roteiro gravado: parte do sistema vazio, como na sessão original,
+        # para que números de conta e clientes sejam os mesmos
+        roteiros = [ler_roteiro(args.roteiro)] * args.threads
+    else:
+        contas = args.contas if args.alvo == 'final' else 1
+        preparacao = gerar_preparacao(args.alvo, contas)
+        if preparacao:
+            executar(menu, [preparacao])
+        roteiros = [gerar_roteiro(args.alvo, args.gerar, contas, args.semente + i) for i in range(args.threads)]
+
+    resultado = executar(menu, roteiros, args.mostrar_saida)
+    imprimir_estatisticas(resultado, args.threads)
+
+if __name__ == "__main__":
+    main()